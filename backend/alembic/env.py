@@ -70,7 +70,12 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            # Commit each revision separately so migrations that build
+            # indexes CONCURRENTLY inside autocommit_block() only flush
+            # their own pending DDL.
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -21,7 +21,7 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     op.create_table(
         'ingredient_images',
-        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column('id', sa.BigInteger, sa.Identity(), primary_key=True),
         sa.Column('ingredient_id', sa.Integer(), nullable=False),
         sa.Column('image_url', sa.Text(), nullable=False),
         sa.Column('thumbnail_url', sa.Text(), nullable=True),
@@ -37,17 +37,36 @@ def upgrade() -> None:
         sa.Column('display_order', sa.Integer(), default=0, server_default='0'),
         sa.Column('relevance_score', sa.Integer(), nullable=True),
         sa.Column('quality_score', sa.Integer(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
         sa.ForeignKeyConstraint(['ingredient_id'], ['ingredients.id'], ondelete='CASCADE'),
     )
     
-    # Create indexes for better query performance
-    op.create_index('ix_ingredient_images_ingredient_id', 'ingredient_images', ['ingredient_id'])
-    op.create_index('ix_ingredient_images_is_primary', 'ingredient_images', ['is_primary'])
+    # Keep updated_at current on the database side
+    op.execute("""
+        CREATE TRIGGER update_ingredient_images_updated_at
+        BEFORE UPDATE ON ingredient_images
+        FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
+    """)
+    
+    # Create indexes for better query performance (CONCURRENTLY so writes aren't blocked)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_ingredient_images_ingredient_id', 'ingredient_images', ['ingredient_id'], postgresql_concurrently=True)
+        # Partial unique index: only primary rows are indexed, and each
+        # ingredient can have at most one primary image
+        op.create_index(
+            'ix_ingredient_images_is_primary',
+            'ingredient_images',
+            ['ingredient_id'],
+            unique=True,
+            postgresql_where=sa.text('is_primary = true'),
+            postgresql_concurrently=True
+        )
 
 
 def downgrade() -> None:
-    op.drop_index('ix_ingredient_images_is_primary')
-    op.drop_index('ix_ingredient_images_ingredient_id')
+    op.execute("DROP TRIGGER IF EXISTS update_ingredient_images_updated_at ON ingredient_images;")
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_ingredient_images_is_primary', postgresql_concurrently=True)
+        op.drop_index('ix_ingredient_images_ingredient_id', postgresql_concurrently=True)
     op.drop_table('ingredient_images')
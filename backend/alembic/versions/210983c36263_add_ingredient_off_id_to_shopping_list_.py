@@ -21,8 +21,14 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # Add ingredient_off_id column to shopping_list_items
     op.add_column('shopping_list_items', sa.Column('ingredient_off_id', sa.String(255), nullable=True))
+    
+    # Index the new lookup column (not auto-indexed by PostgreSQL)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_shopping_list_items_off_id', 'shopping_list_items', ['ingredient_off_id'], postgresql_concurrently=True)
 
 
 def downgrade() -> None:
-    # Remove ingredient_off_id column from shopping_list_items
+    # Remove ingredient_off_id column and its index from shopping_list_items
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_shopping_list_items_off_id', table_name='shopping_list_items', postgresql_concurrently=True)
     op.drop_column('shopping_list_items', 'ingredient_off_id')
@@ -21,8 +21,14 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     # Add equipment column to recipes table
     op.add_column('recipes', sa.Column('equipment', sa.ARRAY(sa.Text()), nullable=True))
+    
+    # GIN index so containment lookups (equipment @> ARRAY['oven']) can use an index
+    with op.get_context().autocommit_block():
+        op.create_index('ix_recipes_equipment_gin', 'recipes', ['equipment'], postgresql_using='gin', postgresql_concurrently=True)
 
 
 def downgrade() -> None:
-    # Remove equipment column from recipes table
+    # Remove equipment column and its index from recipes table
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_recipes_equipment_gin', table_name='recipes', postgresql_concurrently=True)
     op.drop_column('recipes', 'equipment')
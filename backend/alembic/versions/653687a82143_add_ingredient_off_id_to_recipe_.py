@@ -22,6 +22,10 @@ def upgrade() -> None:
     # Add new ingredient_off_id column
     op.add_column('recipe_ingredients', sa.Column('ingredient_off_id', sa.String(length=255), nullable=True))
     
+    # Index the new lookup column (not auto-indexed by PostgreSQL)
+    with op.get_context().autocommit_block():
+        op.create_index('ix_recipe_ingredients_off_id', 'recipe_ingredients', ['ingredient_off_id'], postgresql_concurrently=True)
+    
     # Make old ingredient_id nullable for backward compatibility
     op.alter_column('recipe_ingredients', 'ingredient_id',
                existing_type=sa.INTEGER(),
@@ -32,7 +36,9 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    # Remove the new column
+    # Remove the new column and its index
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_recipe_ingredients_off_id', table_name='recipe_ingredients', postgresql_concurrently=True)
     op.drop_column('recipe_ingredients', 'ingredient_off_id')
     
     # Restore ingredient_id to NOT NULL
@@ -19,16 +19,22 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add new columns to recipes table
-    op.add_column('recipes', sa.Column('difficulty_level', sa.String(length=50), nullable=True))
-    op.add_column('recipes', sa.Column('temperature', sa.Integer(), nullable=True))
-    op.add_column('recipes', sa.Column('temperature_unit', sa.String(length=10), nullable=True))
-    op.add_column('recipes', sa.Column('notes', sa.Text(), nullable=True))
+    # Add new columns to recipes table in a single ALTER TABLE (one lock, one catalog update)
+    op.execute("""
+        ALTER TABLE recipes
+            ADD COLUMN difficulty_level VARCHAR(50),
+            ADD COLUMN temperature INTEGER,
+            ADD COLUMN temperature_unit VARCHAR(10),
+            ADD COLUMN notes TEXT
+    """)
 
 
 def downgrade() -> None:
     # Remove columns in reverse order
-    op.drop_column('recipes', 'notes')
-    op.drop_column('recipes', 'temperature_unit')
-    op.drop_column('recipes', 'temperature')
-    op.drop_column('recipes', 'difficulty_level')
+    op.execute("""
+        ALTER TABLE recipes
+            DROP COLUMN notes,
+            DROP COLUMN temperature_unit,
+            DROP COLUMN temperature,
+            DROP COLUMN difficulty_level
+    """)
@@ -19,78 +19,101 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Create ingredient_categories table
-    op.create_table(
-        'ingredient_categories',
-        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
-        sa.Column('name', sa.String(100), nullable=False, unique=True),
-        sa.Column('parent_category_id', sa.dialects.postgresql.UUID(as_uuid=True), sa.ForeignKey('ingredient_categories.id'), nullable=True),
-        sa.Column('display_order', sa.Integer, nullable=True),
-        sa.Column('icon', sa.String(50), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-    
-    # Create units table
-    op.create_table(
-        'units',
-        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
-        sa.Column('name', sa.String(50), nullable=False, unique=True),
-        sa.Column('abbreviation', sa.String(20), nullable=True),
-        sa.Column('type', sa.String(50), nullable=True),  # 'volume', 'weight', 'unit', 'temperature'
-        sa.Column('system', sa.String(20), nullable=True),  # 'metric', 'imperial', 'both'
-        sa.Column('conversion_to_base', sa.Numeric(10, 6), nullable=True),
-        sa.Column('base_unit', sa.String(50), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-    
-    # Create ingredients table
-    op.create_table(
-        'ingredients',
-        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
-        sa.Column('name', sa.String(255), nullable=False, unique=True),
-        sa.Column('name_plural', sa.String(255), nullable=True),
-        sa.Column('category_id', sa.dialects.postgresql.UUID(as_uuid=True), sa.ForeignKey('ingredient_categories.id'), nullable=True),
-        sa.Column('subcategory', sa.String(100), nullable=True),
-        sa.Column('default_unit', sa.String(50), nullable=True),
-        sa.Column('aliases', sa.dialects.postgresql.ARRAY(sa.Text), nullable=True),
-        sa.Column('is_active', sa.Boolean, default=True, server_default='true'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
-    )
-    
-    # Create recipe_ingredients junction table
-    op.create_table(
-        'recipe_ingredients',
-        sa.Column('id', sa.dialects.postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
-        sa.Column('recipe_id', sa.dialects.postgresql.UUID(as_uuid=True), sa.ForeignKey('recipes.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('ingredient_id', sa.dialects.postgresql.UUID(as_uuid=True), sa.ForeignKey('ingredients.id', ondelete='RESTRICT'), nullable=False),
-        sa.Column('quantity', sa.Numeric(10, 3), nullable=True),
-        sa.Column('quantity_max', sa.Numeric(10, 3), nullable=True),  # for ranges
-        sa.Column('unit', sa.String(50), nullable=True),
-        sa.Column('preparation_notes', sa.Text, nullable=True),  # "chopped", "diced", etc.
-        sa.Column('is_optional', sa.Boolean, default=False, server_default='false'),
-        sa.Column('display_order', sa.Integer, nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
-    
-    # Add new columns to recipes table
-    op.add_column('recipes', sa.Column('difficulty_level', sa.String(50), nullable=True))
-    op.add_column('recipes', sa.Column('temperature', sa.Integer, nullable=True))
-    op.add_column('recipes', sa.Column('temperature_unit', sa.String(10), nullable=True))
-    op.add_column('recipes', sa.Column('notes', sa.Text, nullable=True))
-    
-    # Create indexes for better performance
-    op.create_index('idx_ingredients_name', 'ingredients', ['name'])
-    op.create_index('idx_ingredients_category', 'ingredients', ['category_id'])
-    op.create_index('idx_recipe_ingredients_recipe', 'recipe_ingredients', ['recipe_id'])
-    op.create_index('idx_recipe_ingredients_ingredient', 'recipe_ingredients', ['ingredient_id'])
-    
-    # Create trigger for ingredients updated_at
-    op.execute("""
-        CREATE TRIGGER update_ingredients_updated_at 
+    # Create tables, extend recipes and add the updated_at trigger in a
+    # single multi-statement round-trip. Lookup tables that are never exposed
+    # outside the database use sequential BIGINT identity keys rather than
+    # random UUIDs to keep their B-tree inserts append-only.
+    op.execute(sa.text("""
+        -- Trigram support for fuzzy ingredient name search
+        CREATE EXTENSION IF NOT EXISTS pg_trgm;
+        
+        -- ingredient_categories
+        CREATE TABLE ingredient_categories (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            name VARCHAR(100) NOT NULL UNIQUE,
+            parent_category_id BIGINT REFERENCES ingredient_categories (id),
+            display_order INTEGER,
+            icon VARCHAR(50),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- units
+        CREATE TABLE units (
+            id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+            name VARCHAR(50) NOT NULL UNIQUE,
+            abbreviation VARCHAR(20),
+            type VARCHAR(50),  -- 'volume', 'weight', 'unit', 'temperature'
+            system VARCHAR(20),  -- 'metric', 'imperial', 'both'
+            conversion_to_base NUMERIC(10, 6),
+            base_unit VARCHAR(50),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        );
+        
+        -- ingredients
+        CREATE TABLE ingredients (
+            id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+            name VARCHAR(255) NOT NULL UNIQUE,
+            name_plural VARCHAR(255),
+            category_id BIGINT REFERENCES ingredient_categories (id),
+            subcategory VARCHAR(100),
+            default_unit VARCHAR(50),
+            aliases TEXT[],
+            is_active BOOLEAN DEFAULT true,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        ) WITH (fillfactor = 80);  -- leave room for HOT updates
+        
+        -- recipe_ingredients junction table
+        CREATE TABLE recipe_ingredients (
+            id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+            recipe_id UUID NOT NULL REFERENCES recipes (id) ON DELETE CASCADE,
+            ingredient_id UUID NOT NULL REFERENCES ingredients (id) ON DELETE RESTRICT,
+            quantity NUMERIC(10, 3),
+            quantity_max NUMERIC(10, 3),  -- for ranges
+            unit VARCHAR(50),
+            preparation_notes TEXT,  -- "chopped", "diced", etc.
+            is_optional BOOLEAN DEFAULT false,
+            display_order INTEGER,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+        ) WITH (fillfactor = 80);
+        
+        -- New columns on recipes
+        ALTER TABLE recipes
+            ADD COLUMN difficulty_level VARCHAR(50),
+            ADD COLUMN temperature INTEGER,
+            ADD COLUMN temperature_unit VARCHAR(10),
+            ADD COLUMN notes TEXT;
+        
+        -- Trigger for ingredients updated_at
+        CREATE TRIGGER update_ingredients_updated_at
         BEFORE UPDATE ON ingredients
         FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
-    """)
+    """))
+    
+    # Create indexes for better performance. CONCURRENTLY can't run inside
+    # a transaction block, so these stay out of the batched DDL above.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_ingredients_name', 'ingredients', ['name'], postgresql_concurrently=True)
+        op.create_index(
+            'idx_ingredients_name_trgm',
+            'ingredients',
+            ['name'],
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index('idx_ingredients_aliases_gin', 'ingredients', ['aliases'], postgresql_using='gin', postgresql_concurrently=True)
+        op.create_index('idx_ingredients_category', 'ingredients', ['category_id'], postgresql_concurrently=True)
+        # No separate recipe_id index: the composite's leading column covers
+        # recipe_id lookups, and a second index would only cost writes
+        op.create_index(
+            'idx_recipe_ingredients_recipe_order',
+            'recipe_ingredients',
+            ['recipe_id', 'display_order'],
+            postgresql_include=['ingredient_id', 'quantity', 'unit'],
+            postgresql_concurrently=True
+        )
+        op.create_index('idx_recipe_ingredients_ingredient', 'recipe_ingredients', ['ingredient_id'], postgresql_concurrently=True)
 
 
 def downgrade() -> None:
@@ -98,16 +121,22 @@ def downgrade() -> None:
     op.execute("DROP TRIGGER IF EXISTS update_ingredients_updated_at ON ingredients;")
     
     # Drop indexes
-    op.drop_index('idx_recipe_ingredients_ingredient')
-    op.drop_index('idx_recipe_ingredients_recipe')
-    op.drop_index('idx_ingredients_category')
-    op.drop_index('idx_ingredients_name')
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_recipe_ingredients_ingredient', postgresql_concurrently=True)
+        op.drop_index('idx_recipe_ingredients_recipe_order', postgresql_concurrently=True)
+        op.drop_index('idx_ingredients_category', postgresql_concurrently=True)
+        op.drop_index('idx_ingredients_aliases_gin', postgresql_concurrently=True)
+        op.drop_index('idx_ingredients_name_trgm', postgresql_concurrently=True)
+        op.drop_index('idx_ingredients_name', postgresql_concurrently=True)
     
     # Remove columns from recipes
-    op.drop_column('recipes', 'notes')
-    op.drop_column('recipes', 'temperature_unit')
-    op.drop_column('recipes', 'temperature')
-    op.drop_column('recipes', 'difficulty_level')
+    op.execute("""
+        ALTER TABLE recipes
+            DROP COLUMN notes,
+            DROP COLUMN temperature_unit,
+            DROP COLUMN temperature,
+            DROP COLUMN difficulty_level
+    """)
     
     # Drop tables in reverse order
     op.drop_table('recipe_ingredients')
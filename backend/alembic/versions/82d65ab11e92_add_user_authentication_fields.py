@@ -17,46 +17,79 @@ down_revision: Union[str, None] = '51d56accfc10'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per backfill statement
+BACKFILL_BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
-    # Add username column
-    op.add_column('users', sa.Column('username', sa.String(length=100), nullable=True))
-    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True)
-    
-    # Add password_hash column
-    op.add_column('users', sa.Column('password_hash', sa.String(length=255), nullable=True))
-    
-    # Add role column with enum type
-    op.execute("CREATE TYPE userrole AS ENUM ('admin', 'collaborator', 'reader')")
-    op.add_column('users', sa.Column('role', sa.Enum('admin', 'collaborator', 'reader', name='userrole'), nullable=True))
+    # Create role enum type (idempotent, so re-applying the revision or a
+    # pre-existing type doesn't abort the migration)
+    op.execute("""
+        DO $$ BEGIN
+            CREATE TYPE userrole AS ENUM ('admin', 'collaborator', 'reader');
+        EXCEPTION
+            WHEN duplicate_object THEN NULL;
+        END $$;
+    """)
     
-    # Add is_active column
-    op.add_column('users', sa.Column('is_active', sa.Boolean(), nullable=True))
+    # Add username, password_hash, role and is_active columns and make oauth
+    # fields nullable in a single ALTER TABLE
+    op.execute("""
+        ALTER TABLE users
+            ADD COLUMN username VARCHAR(100),
+            ADD COLUMN password_hash VARCHAR(255),
+            ADD COLUMN role userrole,
+            ADD COLUMN is_active BOOLEAN,
+            ALTER COLUMN oauth_provider DROP NOT NULL,
+            ALTER COLUMN oauth_provider_id DROP NOT NULL
+    """)
     
-    # Make oauth fields nullable
-    op.alter_column('users', 'oauth_provider', nullable=True)
-    op.alter_column('users', 'oauth_provider_id', nullable=True)
-    
-    # Set default values for existing rows
-    op.execute("UPDATE users SET role = 'reader' WHERE role IS NULL")
-    op.execute("UPDATE users SET is_active = true WHERE is_active IS NULL")
-    op.execute("UPDATE users SET username = SPLIT_PART(email, '@', 1) WHERE username IS NULL")
+    # Set default values for existing rows in bounded batches, each committed
+    # on its own so lock durations and WAL bursts stay small
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(sa.text("""
+                WITH batch AS (
+                    SELECT id FROM users
+                    WHERE role IS NULL OR is_active IS NULL OR username IS NULL
+                    LIMIT :batch_size
+                    FOR UPDATE
+                )
+                UPDATE users SET
+                    role = COALESCE(users.role, 'reader'),
+                    is_active = COALESCE(users.is_active, true),
+                    username = COALESCE(users.username, SPLIT_PART(users.email, '@', 1))
+                FROM batch
+                WHERE users.id = batch.id
+            """), {"batch_size": BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
     
     # Make new columns non-nullable
-    op.alter_column('users', 'role', nullable=False)
-    op.alter_column('users', 'is_active', nullable=False)
-    op.alter_column('users', 'username', nullable=False)
+    op.execute("""
+        ALTER TABLE users
+            ALTER COLUMN role SET NOT NULL,
+            ALTER COLUMN is_active SET NOT NULL,
+            ALTER COLUMN username SET NOT NULL
+    """)
+    
+    # Build the username index once the backfill is done, without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=True, postgresql_concurrently=True)
 
 
 def downgrade() -> None:
-    # Remove new columns
-    op.drop_index(op.f('ix_users_username'), table_name='users')
-    op.drop_column('users', 'username')
-    op.drop_column('users', 'password_hash')
-    op.drop_column('users', 'is_active')
-    op.drop_column('users', 'role')
-    op.execute('DROP TYPE userrole')
-    
-    # Restore oauth fields to non-nullable
-    op.alter_column('users', 'oauth_provider', nullable=False)
-    op.alter_column('users', 'oauth_provider_id', nullable=False)
+    # Remove new columns and restore oauth fields to non-nullable
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_users_username'), table_name='users', postgresql_concurrently=True)
+    op.execute("""
+        ALTER TABLE users
+            DROP COLUMN username,
+            DROP COLUMN password_hash,
+            DROP COLUMN is_active,
+            DROP COLUMN role,
+            ALTER COLUMN oauth_provider SET NOT NULL,
+            ALTER COLUMN oauth_provider_id SET NOT NULL
+    """)
+    op.execute('DROP TYPE IF EXISTS userrole')
@@ -19,47 +19,82 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Drop and recreate ingredients table with integer ID and bilingual support
-    op.execute('DROP TABLE IF EXISTS recipe_ingredients CASCADE')
-    op.execute('DROP TABLE IF EXISTS ingredients CASCADE')
+    # Convert ingredients to integer IDs with bilingual support in place
+    # rather than dropping and recreating the tables. Existing UUID ids
+    # can't be cast to INTEGER, so rows are renumbered from a temporary
+    # serial column and the new ids are carried over to recipe_ingredients.
+    op.execute("ALTER TABLE recipe_ingredients DROP CONSTRAINT IF EXISTS recipe_ingredients_ingredient_id_fkey")
+    op.execute("""
+        ALTER TABLE ingredients
+            DROP CONSTRAINT IF EXISTS ingredients_name_key,
+            ADD COLUMN english_name VARCHAR(255),
+            ADD COLUMN french_name VARCHAR(255),
+            ADD COLUMN gender VARCHAR(1),
+            ADD COLUMN notes TEXT,
+            ADD COLUMN new_id SERIAL
+    """)
+    op.execute("UPDATE ingredients SET english_name = name, french_name = name")
     
-    # Create new ingredients table with integer ID
-    op.create_table(
-        'ingredients',
-        sa.Column('id', sa.Integer, primary_key=True, autoincrement=False),
-        sa.Column('name', sa.String(255), nullable=False),
-        sa.Column('english_name', sa.String(255), nullable=False),
-        sa.Column('french_name', sa.String(255), nullable=False),
-        sa.Column('gender', sa.String(1), nullable=True),
-        sa.Column('name_plural', sa.String(255), nullable=True),
-        sa.Column('category_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('ingredient_categories.id'), nullable=True),
-        sa.Column('subcategory', sa.String(100), nullable=True),
-        sa.Column('default_unit', sa.String(50), nullable=True),
-        sa.Column('aliases', postgresql.ARRAY(sa.Text), nullable=True),
-        sa.Column('notes', sa.Text, nullable=True),
-        sa.Column('is_active', sa.Boolean, server_default='true'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
-    )
+    # Remap recipe_ingredients.ingredient_id to the new integer ids
+    op.execute("ALTER TABLE recipe_ingredients ADD COLUMN new_ingredient_id INTEGER")
+    op.execute("""
+        UPDATE recipe_ingredients ri SET new_ingredient_id = i.new_id
+        FROM ingredients i
+        WHERE i.id = ri.ingredient_id
+    """)
+    op.execute("ALTER TABLE recipe_ingredients DROP COLUMN ingredient_id")
+    op.execute("ALTER TABLE recipe_ingredients RENAME COLUMN new_ingredient_id TO ingredient_id")
+    op.execute("ALTER TABLE recipe_ingredients ALTER COLUMN ingredient_id SET NOT NULL")
     
-    # Recreate recipe_ingredients table with integer foreign key
-    op.create_table(
-        'recipe_ingredients',
-        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
-        sa.Column('recipe_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('recipes.id', ondelete='CASCADE'), nullable=False),
-        sa.Column('ingredient_id', sa.Integer, sa.ForeignKey('ingredients.id', ondelete='RESTRICT'), nullable=False),
-        sa.Column('quantity', sa.Numeric(10, 3), nullable=True),
-        sa.Column('quantity_max', sa.Numeric(10, 3), nullable=True),
-        sa.Column('unit', sa.String(50), nullable=True),
-        sa.Column('preparation_notes', sa.Text, nullable=True),
-        sa.Column('is_optional', sa.Boolean, server_default='false'),
-        sa.Column('display_order', sa.Integer, nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-    )
+    # Swap the integer column in as the primary key. The temporary serial
+    # default is replaced by an identity column (BY DEFAULT, so CSV-derived
+    # ids can still be inserted explicitly) starting after the current max.
+    op.execute("ALTER TABLE ingredients DROP CONSTRAINT ingredients_pkey, DROP COLUMN id")
+    op.execute("ALTER TABLE ingredients RENAME COLUMN new_id TO id")
+    op.execute("""
+        ALTER TABLE ingredients
+            ALTER COLUMN id DROP DEFAULT,
+            ALTER COLUMN english_name SET NOT NULL,
+            ALTER COLUMN french_name SET NOT NULL,
+            ADD PRIMARY KEY (id)
+    """)
+    op.execute("DROP SEQUENCE IF EXISTS ingredients_new_id_seq")
+    op.execute("ALTER TABLE ingredients ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY")
+    op.execute("""
+        SELECT setval(pg_get_serial_sequence('ingredients', 'id'), COALESCE(MAX(id), 0) + 1, false)
+        FROM ingredients
+    """)
     
     # Add bilingual columns to ingredient_categories
-    op.add_column('ingredient_categories', sa.Column('name_en', sa.String(100), nullable=True))
-    op.add_column('ingredient_categories', sa.Column('name_fr', sa.String(100), nullable=True))
+    op.execute("""
+        ALTER TABLE ingredient_categories
+            ADD COLUMN name_en VARCHAR(100),
+            ADD COLUMN name_fr VARCHAR(100)
+    """)
+    
+    # Add the ingredient foreign key as NOT VALID, then validate it in a
+    # separate pass which only takes a SHARE UPDATE EXCLUSIVE lock
+    op.execute("""
+        ALTER TABLE recipe_ingredients
+            ADD CONSTRAINT recipe_ingredients_ingredient_id_fkey
+            FOREIGN KEY (ingredient_id) REFERENCES ingredients(id) ON DELETE RESTRICT NOT VALID
+    """)
+    op.execute("ALTER TABLE recipe_ingredients VALIDATE CONSTRAINT recipe_ingredients_ingredient_id_fkey")
+    
+    # Build lookup indexes once the data is in place. The name, alias and
+    # category indexes from 7a642e86d852 are kept by the in-place alter; the
+    # recipe_ingredients ones went away with the old ingredient_id column.
+    with op.get_context().autocommit_block():
+        op.create_index('idx_ingredients_english_name', 'ingredients', ['english_name'], postgresql_concurrently=True)
+        op.create_index('idx_ingredients_french_name', 'ingredients', ['french_name'], postgresql_concurrently=True)
+        op.create_index('idx_recipe_ingredients_ingredient', 'recipe_ingredients', ['ingredient_id'], postgresql_concurrently=True)
+        op.create_index(
+            'idx_recipe_ingredients_recipe_order',
+            'recipe_ingredients',
+            ['recipe_id', 'display_order'],
+            postgresql_include=['ingredient_id', 'quantity', 'unit'],
+            postgresql_concurrently=True
+        )
 
 
 def downgrade() -> None:
@@ -76,13 +111,13 @@ def downgrade() -> None:
         sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, server_default=sa.text('uuid_generate_v4()')),
         sa.Column('name', sa.String(255), nullable=False, unique=True),
         sa.Column('name_plural', sa.String(255), nullable=True),
-        sa.Column('category_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('ingredient_categories.id'), nullable=True),
+        sa.Column('category_id', sa.BigInteger, sa.ForeignKey('ingredient_categories.id'), nullable=True),
         sa.Column('subcategory', sa.String(100), nullable=True),
         sa.Column('default_unit', sa.String(50), nullable=True),
         sa.Column('aliases', postgresql.ARRAY(sa.Text), nullable=True),
         sa.Column('is_active', sa.Boolean, server_default='true'),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), onupdate=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
     )
     
     op.create_table(
@@ -96,5 +131,24 @@ def downgrade() -> None:
         sa.Column('preparation_notes', sa.Text, nullable=True),
         sa.Column('is_optional', sa.Boolean, server_default='false'),
         sa.Column('display_order', sa.Integer, nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('CURRENT_TIMESTAMP')),
+    )
+    
+    # Restore the indexes 7a642e86d852 created (its downgrade drops them)
+    op.create_index('idx_ingredients_name', 'ingredients', ['name'])
+    op.create_index(
+        'idx_ingredients_name_trgm',
+        'ingredients',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index('idx_ingredients_aliases_gin', 'ingredients', ['aliases'], postgresql_using='gin')
+    op.create_index('idx_ingredients_category', 'ingredients', ['category_id'])
+    op.create_index(
+        'idx_recipe_ingredients_recipe_order',
+        'recipe_ingredients',
+        ['recipe_id', 'display_order'],
+        postgresql_include=['ingredient_id', 'quantity', 'unit']
     )
+    op.create_index('idx_recipe_ingredients_ingredient', 'recipe_ingredients', ['ingredient_id'])
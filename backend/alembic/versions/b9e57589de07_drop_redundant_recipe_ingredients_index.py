@@ -0,0 +1,42 @@
+"""drop_redundant_recipe_ingredients_index
+
+Revision ID: b9e57589de07
+Revises: 82d65ab11e92
+Create Date: 2026-10-17 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e57589de07'
+down_revision: Union[str, None] = '82d65ab11e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Databases migrated before 7a642e86d852 switched to the composite index
+    # still carry the single-column recipe_id index. The leading column of
+    # idx_recipe_ingredients_recipe_order already serves recipe_id lookups,
+    # so the single-column index only adds write and cache overhead.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recipe_ingredients_recipe_order
+            ON recipe_ingredients (recipe_id, display_order)
+            INCLUDE (ingredient_id, quantity, unit)
+        """)
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_recipe_ingredients_recipe")
+
+
+def downgrade() -> None:
+    # Only the redundant index is restored; the composite index belongs to
+    # the earlier revisions
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_recipe_ingredients_recipe
+            ON recipe_ingredients (recipe_id)
+        """)
@@ -0,0 +1,49 @@
+"""add_users_trigram_search_indexes
+
+Revision ID: c4e0a7d2b913
+Revises: a1b936ca145c
+Create Date: 2026-10-17 10:12:47.219364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e0a7d2b913'
+down_revision: Union[str, None] = 'a1b936ca145c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Admin user search filters with ILIKE '%term%' on email and username;
+    # trigram GIN indexes let the planner use a bitmap scan for that
+    # instead of scanning the whole table.
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_trgm',
+            'users',
+            ['email'],
+            postgresql_using='gin',
+            postgresql_ops={'email': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_users_username_trgm',
+            'users',
+            ['username'],
+            postgresql_using='gin',
+            postgresql_ops={'username': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_username_trgm', table_name='users', postgresql_concurrently=True)
+        op.drop_index('ix_users_email_trgm', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,36 @@
+"""add_users_created_at_id_index
+
+Revision ID: e5f3b8c1a247
+Revises: c4e0a7d2b913
+Create Date: 2026-10-17 10:31:05.884120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f3b8c1a247'
+down_revision: Union[str, None] = 'c4e0a7d2b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Admin user list pages with keyset pagination:
+    # WHERE (created_at, id) < (:ts, :id) ORDER BY created_at DESC, id DESC.
+    # A btree on (created_at, id) serves that with a backward index scan.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_created_at_id',
+            'users',
+            ['created_at', 'id'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_created_at_id', table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""add_valid_ingredients_fk
+
+Revision ID: f7a1d4c9e362
+Revises: e5f3b8c1a247
+Create Date: 2026-10-17 11:02:41.517308
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7a1d4c9e362'
+down_revision: Union[str, None] = 'e5f3b8c1a247'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres mirror of the MongoDB ingredient off_ids; the API fills it on
+    # startup (and scripts/sync_valid_ingredients.py on demand)
+    op.create_table(
+        'valid_ingredients',
+        sa.Column('off_id', sa.String(length=255), primary_key=True)
+    )
+    
+    # Off_ids already used by recipes were validated when they were written
+    op.execute("""
+        INSERT INTO valid_ingredients (off_id)
+        SELECT DISTINCT ingredient_off_id
+        FROM recipe_ingredients
+        WHERE ingredient_off_id IS NOT NULL
+    """)
+    
+    # Add the FK without a full-table check under lock, then validate it in
+    # its own transaction (VALIDATE only takes a SHARE UPDATE EXCLUSIVE lock)
+    op.execute("""
+        ALTER TABLE recipe_ingredients
+        ADD CONSTRAINT fk_recipe_ingredients_off_id
+        FOREIGN KEY (ingredient_off_id) REFERENCES valid_ingredients (off_id)
+        NOT VALID
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE recipe_ingredients VALIDATE CONSTRAINT fk_recipe_ingredients_off_id")
+
+
+def downgrade() -> None:
+    op.drop_constraint('fk_recipe_ingredients_off_id', 'recipe_ingredients', type_='foreignkey')
+    op.drop_table('valid_ingredients')
@@ -2,22 +2,116 @@
 Admin API for AI extraction management
 """
 from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any, List
-from datetime import datetime
-import os
+from typing import Optional, Dict, Any, List, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+import threading
+
+import orjson
 
 from app.core.config import settings
-from app.services.ai_recipe_extraction import ai_recipe_service
 from app.core.openai_models import (
-    get_available_models,
-    get_recommended_models,
-    OPENAI_MODELS
+    OPENAI_MODELS,
+    RECOMMENDED_MODELS,
+    VISION_MODELS
 )
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _ai_service():
+    """
+    Resolve the AI extraction service on first use.
+    
+    Importing it pulls in the OpenAI SDK and Pillow, which most admin AI
+    endpoints never need.
+    """
+    from app.services.ai_recipe_extraction import ai_recipe_service
+    return ai_recipe_service
+
+
+@dataclass(frozen=True)
+class _ConfigView:
+    """Snapshot of the AI settings plus derived key state (presence, masked prefix)"""
+    enabled: bool
+    provider: str
+    openai_configured: bool
+    openai_model: str
+    openai_max_tokens: int
+    api_key_prefix: Optional[str]
+    gemini_configured: bool
+    gemini_model: str
+    fallback_enabled: bool
+    upload_dir: str
+    max_upload_size: int
+
+
+def _build_config_view() -> _ConfigView:
+    """Read settings and derive key state"""
+    api_key = settings.OPENAI_API_KEY
+    gemini_key = settings.GOOGLE_AI_API_KEY
+    openai_configured = bool(api_key and api_key.strip())
+    
+    # Extract first few characters of API key for display (masked)
+    api_key_prefix = None
+    if openai_configured:
+        api_key_prefix = f"{api_key[:7]}...{api_key[-4:]}" if len(api_key) > 11 else "sk-..."
+    
+    return _ConfigView(
+        enabled=settings.ENABLE_AI_EXTRACTION,
+        provider=settings.AI_PROVIDER,
+        openai_configured=openai_configured,
+        openai_model=settings.OPENAI_MODEL,
+        openai_max_tokens=settings.OPENAI_MAX_TOKENS,
+        api_key_prefix=api_key_prefix,
+        gemini_configured=bool(gemini_key and gemini_key.strip()),
+        gemini_model=settings.GEMINI_MODEL,
+        fallback_enabled=settings.AI_FALLBACK_ENABLED,
+        upload_dir=settings.UPLOAD_DIR,
+        max_upload_size=settings.MAX_UPLOAD_SIZE
+    )
+
+
+class _AtomicConfig:
+    """
+    Lock-guarded AI config snapshot with a monotonically increasing version.
+    
+    Runtime updates write settings (other modules still read them directly),
+    rebuild the snapshot and bump the version under one lock, so readers
+    never see a half-applied update. This is per process: each Uvicorn
+    worker keeps its own copy.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = 0
+        self._view = _build_config_view()
+    
+    def get(self) -> Tuple[_ConfigView, int]:
+        with self._lock:
+            return self._view, self._version
+    
+    def update(self, changes: Dict[str, Any]) -> Tuple[_ConfigView, int]:
+        """Apply settings changes ({attribute: value}) and publish a new snapshot"""
+        with self._lock:
+            for name, value in changes.items():
+                setattr(settings, name, value)
+            self._version += 1
+            self._view = _build_config_view()
+            return self._view, self._version
+
+
+_ai_config = _AtomicConfig()
+
+
+def _get_config_view() -> _ConfigView:
+    return _ai_config.get()[0]
+
+
 class AIStatusResponse(BaseModel):
     """AI service status response"""
     enabled: bool
@@ -69,29 +163,66 @@ class ExtractionLogResponse(BaseModel):
     created_at: datetime
 
 
-@router.get("/status", response_model=AIStatusResponse)
+# $project stage mapping an AIExtractionLog document to ExtractionLogResponse
+# (optional fields are emitted as null when missing)
+_LOG_PROJECTION: Dict[str, Any] = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "extraction_method": 1,
+    **{
+        field: {"$ifNull": [f"${field}", None]}
+        for field in (
+            "provider",
+            "model_name",
+            "recipe_title",
+            "recipe_id",
+            "confidence_score",
+            "error_message",
+            "total_tokens",
+            "estimated_cost_usd",
+            "processing_time_ms",
+            "image_url",
+        )
+    },
+    "success": 1,
+    "created_at": 1
+}
+
+
+@lru_cache(maxsize=1)
+def _status_payload(view: _ConfigView) -> Dict[str, Any]:
+    """Build the /status response once per config snapshot"""
+    return {
+        "enabled": view.enabled,
+        "provider": view.provider,
+        "openai_configured": view.openai_configured,
+        "openai_model": view.openai_model if view.openai_configured else None,
+        "gemini_configured": view.gemini_configured,
+        "fallback_enabled": view.fallback_enabled,
+        "upload_dir": view.upload_dir,
+        "max_upload_size": view.max_upload_size
+    }
+
+
+@router.get(
+    "/status",
+    response_class=ORJSONResponse,
+    responses={200: {"model": AIStatusResponse}}
+)
 async def get_ai_status():
     """
     Get current AI extraction service status and configuration
     
     Returns current settings and availability status
     """
-    openai_configured = bool(settings.OPENAI_API_KEY and settings.OPENAI_API_KEY.strip())
-    gemini_configured = bool(settings.GOOGLE_AI_API_KEY and settings.GOOGLE_AI_API_KEY.strip())
-    
-    return AIStatusResponse(
-        enabled=settings.ENABLE_AI_EXTRACTION,
-        provider=settings.AI_PROVIDER,
-        openai_configured=openai_configured,
-        openai_model=settings.OPENAI_MODEL if openai_configured else None,
-        gemini_configured=gemini_configured,
-        fallback_enabled=settings.AI_FALLBACK_ENABLED,
-        upload_dir=settings.UPLOAD_DIR,
-        max_upload_size=settings.MAX_UPLOAD_SIZE
-    )
+    return ORJSONResponse(content=_status_payload(_get_config_view()))
 
 
-@router.get("/openai/usage", response_model=OpenAIUsageResponse)
+@router.get(
+    "/openai/usage",
+    response_class=ORJSONResponse,
+    responses={200: {"model": OpenAIUsageResponse}}
+)
 async def get_openai_usage():
     """
     Get OpenAI account information and usage links
@@ -99,23 +230,23 @@ async def get_openai_usage():
     Note: OpenAI API doesn't provide programmatic access to billing/usage data.
     This endpoint returns configuration info and links to the OpenAI dashboard.
     """
-    api_key = settings.OPENAI_API_KEY
-    api_key_configured = bool(api_key and api_key.strip())
-    
-    # Extract first few characters of API key for display (masked)
-    api_key_prefix = None
-    if api_key_configured:
-        api_key_prefix = f"{api_key[:7]}...{api_key[-4:]}" if len(api_key) > 11 else "sk-..."
-    
-    service_available = ai_recipe_service.is_available()
-    
-    return OpenAIUsageResponse(
-        api_key_configured=api_key_configured,
-        api_key_prefix=api_key_prefix,
-        model=settings.OPENAI_MODEL,
-        max_tokens=settings.OPENAI_MAX_TOKENS,
-        service_available=service_available
-    )
+    view = _get_config_view()
+    service_available = _ai_service().is_available()
+    
+    return ORJSONResponse(content={
+        "api_key_configured": view.openai_configured,
+        "api_key_prefix": view.api_key_prefix,
+        "model": view.openai_model,
+        "max_tokens": view.openai_max_tokens,
+        "service_available": service_available
+    })
+
+
+# Accepted values for update_ai_config, with their error-message listings
+_VALID_PROVIDERS_ORDER = ("openai", "gemini", "tesseract", "auto")
+_VALID_PROVIDERS = frozenset(_VALID_PROVIDERS_ORDER)
+_VALID_PROVIDERS_STR = ", ".join(_VALID_PROVIDERS_ORDER)
+_AVAILABLE_MODELS_STR = ", ".join(OPENAI_MODELS)
 
 
 @router.post("/config")
@@ -133,42 +264,50 @@ async def update_ai_config(config: AIConfigUpdate):
         Updated configuration status
     """
     updates = {}
+    changes = {}
     
+    # Validate everything before applying, so a rejected field leaves the
+    # config untouched
     if config.enabled is not None:
-        settings.ENABLE_AI_EXTRACTION = config.enabled
+        changes["ENABLE_AI_EXTRACTION"] = config.enabled
         updates['enabled'] = config.enabled
     
     if config.provider is not None:
-        valid_providers = ['openai', 'gemini', 'tesseract', 'auto']
-        if config.provider not in valid_providers:
+        if config.provider not in _VALID_PROVIDERS:
             raise HTTPException(
                 status_code=400,
                 detail=(
                     f"Invalid provider: {config.provider}. "
-                    f"Must be one of: {', '.join(valid_providers)}"
+                    f"Must be one of: {_VALID_PROVIDERS_STR}"
                 )
             )
-        settings.AI_PROVIDER = config.provider
+        changes["AI_PROVIDER"] = config.provider
         updates['provider'] = config.provider
     
     if config.model is not None:
         # Validate model exists
         if config.model not in OPENAI_MODELS:
-            available = ', '.join(OPENAI_MODELS.keys())
             raise HTTPException(
                 status_code=400,
                 detail=(
                     f"Invalid model: {config.model}. "
-                    f"Available models: {available}"
+                    f"Available models: {_AVAILABLE_MODELS_STR}"
                 )
             )
-        settings.OPENAI_MODEL = config.model
+        changes["OPENAI_MODEL"] = config.model
         updates['model'] = config.model
     
     if config.fallback_enabled is not None:
-        settings.AI_FALLBACK_ENABLED = config.fallback_enabled
+        changes["AI_FALLBACK_ENABLED"] = config.fallback_enabled
         updates['fallback_enabled'] = config.fallback_enabled
     
+    view, _ = _ai_config.update(changes)
+    
+    # Cached responses are keyed on the view; drop the stale entries
+    _status_payload.cache_clear()
+    _providers_payload.cache_clear()
+    _models_payload.cache_clear()
+    
     return {
         "success": True,
         "message": (
@@ -177,72 +316,99 @@ async def update_ai_config(config: AIConfigUpdate):
         ),
         "updates": updates,
         "current_status": {
-            "enabled": settings.ENABLE_AI_EXTRACTION,
-            "provider": settings.AI_PROVIDER,
-            "model": settings.OPENAI_MODEL,
-            "fallback_enabled": settings.AI_FALLBACK_ENABLED
+            "enabled": view.enabled,
+            "provider": view.provider,
+            "model": view.openai_model,
+            "fallback_enabled": view.fallback_enabled
         }
     }
 
 
+# Static part of the /providers response; only configured/available/model
+# are filled in per request
+_PROVIDERS_TEMPLATE: Dict[str, Dict[str, Any]] = {
+    "openai": {
+        "name": "OpenAI GPT-4 Vision",
+        "configured": None,
+        "available": None,
+        "model": None,
+        "cost_per_1k_tokens": {
+            "input": 0.01,  # gpt-4o pricing
+            "output": 0.03
+        },
+        "estimated_cost_per_recipe": 0.04,
+        "accuracy": "95%+",
+        "setup_url": "https://platform.openai.com/api-keys"
+    },
+    "gemini": {
+        "name": "Google Gemini Flash",
+        "configured": None,
+        "available": False,  # Not implemented yet
+        "model": None,
+        "free_tier": "1500 requests/day",
+        "cost_per_1k_tokens": {
+            "input": 0.00,  # Free tier
+            "output": 0.00
+        },
+        "estimated_cost_per_recipe": 0.0,
+        "accuracy": "90%+",
+        "setup_url": "https://aistudio.google.com/app/apikey",
+        "status": "Coming in Phase 2"
+    },
+    "tesseract": {
+        "name": "Tesseract OCR",
+        "configured": True,
+        "available": True,
+        "model": "tesseract",
+        "cost_per_1k_tokens": {
+            "input": 0.0,
+            "output": 0.0
+        },
+        "estimated_cost_per_recipe": 0.0,
+        "accuracy": "60-70%",
+        "setup_url": None
+    }
+}
+
+
+@lru_cache(maxsize=1)
+def _providers_payload(view: _ConfigView, openai_available: bool) -> Dict[str, Any]:
+    """Build the /providers response once per config snapshot"""
+    # Shallow-copy only the entries that carry per-snapshot values
+    openai = dict(_PROVIDERS_TEMPLATE["openai"])
+    openai["configured"] = view.openai_configured
+    openai["available"] = openai_available
+    openai["model"] = view.openai_model
+    
+    gemini = dict(_PROVIDERS_TEMPLATE["gemini"])
+    gemini["configured"] = view.gemini_configured
+    gemini["model"] = view.gemini_model
+    
+    return {
+        "providers": {
+            "openai": openai,
+            "gemini": gemini,
+            "tesseract": _PROVIDERS_TEMPLATE["tesseract"]
+        },
+        "current_provider": view.provider,
+        "fallback_enabled": view.fallback_enabled
+    }
+
+
 @router.get("/providers")
 async def list_available_providers():
     """
     List all available AI providers and their configuration status
     """
-    openai_configured = bool(settings.OPENAI_API_KEY and settings.OPENAI_API_KEY.strip())
-    gemini_configured = bool(settings.GOOGLE_AI_API_KEY and settings.GOOGLE_AI_API_KEY.strip())
+    view = _get_config_view()
     
-    return {
-        "providers": {
-            "openai": {
-                "name": "OpenAI GPT-4 Vision",
-                "configured": openai_configured,
-                "available": openai_configured and ai_recipe_service.is_available(),
-                "model": settings.OPENAI_MODEL,
-                "cost_per_1k_tokens": {
-                    "input": 0.01,  # gpt-4o pricing
-                    "output": 0.03
-                },
-                "estimated_cost_per_recipe": 0.04,
-                "accuracy": "95%+",
-                "setup_url": "https://platform.openai.com/api-keys"
-            },
-            "gemini": {
-                "name": "Google Gemini Flash",
-                "configured": gemini_configured,
-                "available": False,  # Not implemented yet
-                "model": settings.GEMINI_MODEL,
-                "free_tier": "1500 requests/day",
-                "cost_per_1k_tokens": {
-                    "input": 0.00,  # Free tier
-                    "output": 0.00
-                },
-                "estimated_cost_per_recipe": 0.0,
-                "accuracy": "90%+",
-                "setup_url": "https://aistudio.google.com/app/apikey",
-                "status": "Coming in Phase 2"
-            },
-            "tesseract": {
-                "name": "Tesseract OCR",
-                "configured": True,
-                "available": True,
-                "model": "tesseract",
-                "cost_per_1k_tokens": {
-                    "input": 0.0,
-                    "output": 0.0
-                },
-                "estimated_cost_per_recipe": 0.0,
-                "accuracy": "60-70%",
-                "setup_url": None
-            }
-        },
-        "current_provider": settings.AI_PROVIDER,
-        "fallback_enabled": settings.AI_FALLBACK_ENABLED
-    }
+    return _providers_payload(
+        view,
+        view.openai_configured and _ai_service().is_available()
+    )
 
 
-@router.get("/stats")
+@router.get("/stats", response_class=ORJSONResponse)
 async def get_extraction_stats(
     days: int = 30,
     provider: Optional[str] = None
@@ -257,92 +423,134 @@ async def get_extraction_stats(
     Returns:
         Comprehensive usage statistics including costs, tokens, and success rates
     """
-    from datetime import datetime, timedelta
     from app.models.mongodb import AIExtractionLog
     
-    # Calculate date range
-    start_date = datetime.utcnow() - timedelta(days=days)
+    # Calculate date range from a single clock read. Logs store naive UTC
+    # timestamps, so drop tzinfo to keep comparisons and output unchanged
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    start_date = now - timedelta(days=days)
     
     # Build query
     query = {"created_at": {"$gte": start_date}}
     if provider:
         query["provider"] = provider
     
-    # Get all logs in date range
-    logs = await AIExtractionLog.find(query).to_list()
+    # Compute all breakdowns server-side in a single round-trip
+    daily_start = today_midnight - timedelta(days=min(7, days) - 1)
+    pipeline = [
+        {"$match": query},
+        {"$facet": {
+            "summary": [
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": 1},
+                    "successful": {"$sum": {"$cond": ["$success", 1, 0]}},
+                    "total_cost_usd": {"$sum": {"$ifNull": ["$estimated_cost_usd", 0]}},
+                    "avg_confidence": {"$avg": "$confidence_score"},
+                    "avg_processing_time": {"$avg": "$processing_time_ms"}
+                }}
+            ],
+            "by_provider": [
+                {"$group": {
+                    "_id": {"$ifNull": ["$provider", "unknown"]},
+                    "count": {"$sum": 1},
+                    "successful": {"$sum": {"$cond": ["$success", 1, 0]}},
+                    "total_tokens": {"$sum": {"$ifNull": ["$total_tokens", 0]}},
+                    "total_cost_usd": {"$sum": {"$ifNull": ["$estimated_cost_usd", 0]}}
+                }}
+            ],
+            "by_method": [
+                {"$group": {
+                    "_id": {"$ifNull": ["$extraction_method", "unknown"]},
+                    "count": {"$sum": 1}
+                }}
+            ],
+            # Token usage (AI only)
+            "tokens": [
+                {"$match": {"extraction_method": "ai", "total_tokens": {"$nin": [None, 0]}}},
+                {"$group": {
+                    "_id": None,
+                    "total": {"$sum": "$total_tokens"},
+                    "prompt": {"$sum": {"$ifNull": ["$prompt_tokens", 0]}},
+                    "completion": {"$sum": {"$ifNull": ["$completion_tokens", 0]}},
+                    "count": {"$sum": 1}
+                }}
+            ],
+            # Daily totals for the chart (days without logs are filled in below)
+            "daily": [
+                {"$match": {"created_at": {"$gte": daily_start}}},
+                {"$group": {
+                    "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at"}},
+                    "total": {"$sum": 1},
+                    "successful": {"$sum": {"$cond": ["$success", 1, 0]}},
+                    "failed": {"$sum": {"$cond": ["$success", 0, 1]}},
+                    "cost_usd": {"$sum": {"$ifNull": ["$estimated_cost_usd", 0]}}
+                }}
+            ]
+        }}
+    ]
+    facets = (await AIExtractionLog.aggregate(pipeline).to_list())[0]
+    view = _get_config_view()
     
     # Calculate statistics
-    total_extractions = len(logs)
-    successful_extractions = sum(1 for log in logs if log.success)
-    failed_extractions = sum(1 for log in logs if not log.success)
+    # Everything below only reshapes the facet rows (one per provider/method,
+    # at most 7 days), so it stays on the event loop rather than a threadpool
+    summary = facets["summary"][0] if facets["summary"] else {}
+    total_extractions = summary.get("total", 0)
+    successful_extractions = summary.get("successful", 0)
+    failed_extractions = total_extractions - successful_extractions
     
     # By provider
     by_provider = {}
-    for log in logs:
-        prov = log.provider or "unknown"
-        if prov not in by_provider:
-            by_provider[prov] = {
-                "count": 0,
-                "successful": 0,
-                "failed": 0,
-                "total_tokens": 0,
-                "total_cost_usd": 0.0
-            }
-        by_provider[prov]["count"] += 1
-        if log.success:
-            by_provider[prov]["successful"] += 1
-        else:
-            by_provider[prov]["failed"] += 1
-        if log.total_tokens:
-            by_provider[prov]["total_tokens"] += log.total_tokens
-        if log.estimated_cost_usd:
-            by_provider[prov]["total_cost_usd"] += log.estimated_cost_usd
+    cost_by_provider = {}
+    for row in facets["by_provider"]:
+        cost = float(row["total_cost_usd"])
+        by_provider[row["_id"]] = {
+            "count": row["count"],
+            "successful": row["successful"],
+            "failed": row["count"] - row["successful"],
+            "total_tokens": row["total_tokens"],
+            "total_cost_usd": cost
+        }
+        cost_by_provider[row["_id"]] = round(cost, 4)
     
     # Token usage (AI only)
-    ai_logs = [log for log in logs if log.extraction_method == 'ai' and log.total_tokens]
-    total_tokens = sum(log.total_tokens for log in ai_logs)
-    total_prompt_tokens = sum(log.prompt_tokens or 0 for log in ai_logs)
-    total_completion_tokens = sum(log.completion_tokens or 0 for log in ai_logs)
+    tokens = facets["tokens"][0] if facets["tokens"] else {}
+    total_tokens = tokens.get("total", 0)
+    total_prompt_tokens = tokens.get("prompt", 0)
+    total_completion_tokens = tokens.get("completion", 0)
+    ai_extractions = tokens.get("count", 0)
     
     # Cost calculation
-    total_cost = sum(log.estimated_cost_usd or 0 for log in logs)
+    total_cost = summary.get("total_cost_usd", 0)
     
-    # Average confidence
-    confidence_logs = [log for log in logs if log.confidence_score is not None]
-    avg_confidence = sum(log.confidence_score for log in confidence_logs) / len(confidence_logs) if confidence_logs else 0
-    
-    # Average processing time
-    processing_logs = [log for log in logs if log.processing_time_ms is not None]
-    avg_processing_time = sum(log.processing_time_ms for log in processing_logs) / len(processing_logs) if processing_logs else 0
+    # Averages ($avg skips missing/null values, and is null when none remain)
+    avg_confidence = summary.get("avg_confidence") or 0
+    avg_processing_time = summary.get("avg_processing_time") or 0
     
     # By extraction method
-    by_method = {}
-    for log in logs:
-        method = log.extraction_method or "unknown"
-        if method not in by_method:
-            by_method[method] = 0
-        by_method[method] += 1
+    by_method = {row["_id"]: row["count"] for row in facets["by_method"]}
     
     # Daily breakdown (last 7 days for chart)
+    daily_rows = {row["_id"]: row for row in facets["daily"]}
     daily_stats = []
     for i in range(min(7, days)):
-        day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=i)
-        day_end = day_start + timedelta(days=1)
-        day_logs = [log for log in logs if day_start <= log.created_at < day_end]
+        date = (daily_start + timedelta(days=i)).strftime("%Y-%m-%d")
+        row = daily_rows.get(date, {})
         daily_stats.append({
-            "date": day_start.strftime("%Y-%m-%d"),
-            "total": len(day_logs),
-            "successful": sum(1 for log in day_logs if log.success),
-            "failed": sum(1 for log in day_logs if not log.success),
-            "cost_usd": sum(log.estimated_cost_usd or 0 for log in day_logs)
+            "date": date,
+            "total": row.get("total", 0),
+            "successful": row.get("successful", 0),
+            "failed": row.get("failed", 0),
+            "cost_usd": row.get("cost_usd", 0)
         })
-    daily_stats.reverse()
     
     return {
         "period": {
             "days": days,
             "start_date": start_date.isoformat(),
-            "end_date": datetime.utcnow().isoformat()
+            "end_date": now.isoformat()
         },
         "summary": {
             "total_extractions": total_extractions,
@@ -358,26 +566,30 @@ async def get_extraction_stats(
             "total": total_tokens,
             "prompt": total_prompt_tokens,
             "completion": total_completion_tokens,
-            "ai_extractions": len(ai_logs)
+            "ai_extractions": ai_extractions
         },
         "costs": {
             "total_usd": round(total_cost, 4),
             "average_per_extraction_usd": round(total_cost / total_extractions, 4) if total_extractions > 0 else 0,
-            "by_provider": {
-                prov: round(stats["total_cost_usd"], 4) 
-                for prov, stats in by_provider.items()
-            }
+            "by_provider": cost_by_provider
         },
         "daily_breakdown": daily_stats,
         "current_config": {
-            "enabled": settings.ENABLE_AI_EXTRACTION,
-            "provider": settings.AI_PROVIDER,
-            "fallback_enabled": settings.AI_FALLBACK_ENABLED
+            "enabled": view.enabled,
+            "provider": view.provider,
+            "fallback_enabled": view.fallback_enabled
         }
     }
 
 
-@router.get("/logs", response_model=List[ExtractionLogResponse])
+@router.get(
+    "/logs",
+    response_class=StreamingResponse,
+    responses={200: {
+        "model": List[ExtractionLogResponse],
+        "content": {"application/json": {}}
+    }}
+)
 async def get_extraction_logs(
     limit: int = Query(50, ge=1, le=500),
     skip: int = Query(0, ge=0),
@@ -405,29 +617,39 @@ async def get_extraction_logs(
     if provider:
         query["provider"] = provider
     
-    # Get logs sorted by most recent first
-    logs = await AIExtractionLog.find(query).sort("-created_at").skip(skip).limit(limit).to_list()
-    
-    # Convert to response format
-    return [
-        ExtractionLogResponse(
-            id=str(log.id),
-            extraction_method=log.extraction_method,
-            provider=log.provider,
-            model_name=log.model_name,
-            recipe_title=log.recipe_title,
-            recipe_id=log.recipe_id,
-            confidence_score=log.confidence_score,
-            success=log.success,
-            error_message=log.error_message,
-            total_tokens=log.total_tokens,
-            estimated_cost_usd=log.estimated_cost_usd,
-            processing_time_ms=log.processing_time_ms,
-            image_url=log.image_url,
-            created_at=log.created_at
-        )
-        for log in logs
+    # Get logs sorted by most recent first, projected straight into the
+    # ExtractionLogResponse shape so no model is built per row
+    pipeline = [
+        {"$match": query},
+        {"$sort": {"created_at": -1}},
+        {"$skip": skip},
+        {"$limit": limit},
+        {"$project": _LOG_PROJECTION}
     ]
+    cursor = AIExtractionLog.aggregate(pipeline)
+    
+    async def stream_logs():
+        # Emit a JSON array one row at a time instead of buffering the page
+        yield b"["
+        first = True
+        async for log in cursor:
+            if not first:
+                yield b","
+            first = False
+            yield orjson.dumps(log)
+        yield b"]"
+    
+    return StreamingResponse(stream_logs(), media_type="application/json")
+
+
+@lru_cache(maxsize=4)
+def _models_payload(vision_only: bool, current_model: str) -> Dict[str, Any]:
+    """Build the /models response once per (filter, current model) pair"""
+    return {
+        "models": VISION_MODELS if vision_only else OPENAI_MODELS,
+        "current_model": current_model,
+        "recommended": RECOMMENDED_MODELS
+    }
 
 
 @router.get("/models")
@@ -443,15 +665,4 @@ async def list_available_models(
     Returns models that can be used for recipe extraction.
     Vision models are required for image-based extraction.
     """
-    if vision_only:
-        models = get_available_models(vision_required=True)
-    else:
-        models = OPENAI_MODELS
-    
-    return {
-        "models": models,
-        "current_model": settings.OPENAI_MODEL,
-        "recommended": get_recommended_models()
-    }
-
-
+    return _models_payload(vision_only, _get_config_view().openai_model)
@@ -4,8 +4,12 @@ Admin Ingredients API routes - MongoDB Version
 This endpoint now uses the OpenFoodFacts MongoDB data.
 Old PostgreSQL-based ingredients have been replaced.
 """
+import asyncio
+
 from fastapi import APIRouter, Query, HTTPException
-from typing import List, Optional
+from fastapi.responses import ORJSONResponse
+from bson import ObjectId
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel
 from app.models.mongodb import Ingredient, Category
 
@@ -52,8 +56,42 @@ class PaginatedResponse(BaseModel):
     pages: int
 
 
+def _id_or_off_id_query(value: str) -> Dict[str, Any]:
+    """Match a document by OpenFoodFacts off_id, or by MongoDB _id when valid"""
+    clauses: List[Dict[str, Any]] = [{"off_id": value}]
+    if ObjectId.is_valid(value):
+        clauses.append({"_id": ObjectId(value)})
+    return {"$or": clauses}
+
+
+def _facet_count(facets: Dict[str, Any], name: str) -> int:
+    """Read a {"$count": "n"} facet branch (empty when nothing matched)"""
+    rows = facets[name]
+    return rows[0]["n"] if rows else 0
+
+
+def _ingredient_projection(language: str) -> Dict[str, Any]:
+    """$project stage mapping an Ingredient document to IngredientResponse"""
+    return {
+        "_id": 0,
+        "id": {"$toString": "$_id"},
+        "off_id": 1,
+        "name": Ingredient.name_expr(language),
+        "english_name": Ingredient.name_expr("en"),
+        "french_name": Ingredient.name_expr("fr"),
+        "is_vegan": Ingredient.property_flag_expr("vegan"),
+        "is_vegetarian": Ingredient.property_flag_expr("vegetarian"),
+        "custom": {"$ifNull": ["$custom", False]},
+        "wikidata_id": {"$ifNull": ["$wikidata_id", None]}
+    }
+
+
 # Categories endpoints (must be before /{ingredient_id} to avoid route conflict)
-@router.get("/categories", response_model=List[CategoryResponse])
+@router.get(
+    "/categories",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[CategoryResponse]}}
+)
 async def list_categories(
     language: str = Query("en", description="Language"),
     top_level_only: bool = Query(False, description="Only top-level categories"),
@@ -66,36 +104,41 @@ async def list_categories(
     Returns categories sorted by number of children (most useful categories first).
     Set top_level_only=true to only get root categories.
     """
-    if top_level_only:
-        categories = await Category.find({"parents": {"$size": 0}}).to_list()
+    match = {"parents": {"$size": 0}} if top_level_only else {}
+    
+    # Sort and limit in MongoDB so only `limit` categories are returned
+    if sort_by == "name":
+        sort_stage = {"sort_key": 1, "off_id": 1}
+    elif sort_by == "off_id":
+        sort_stage = {"off_id": 1}
     else:
-        # Get all categories
-        categories = await Category.find_all().to_list()
+        sort_stage = {"children_count": -1, "off_id": 1}
     
-    # Convert to response format
-    category_responses = [
-        CategoryResponse(
-            off_id=cat.off_id,
-            name=cat.get_name(language),
-            english_name=cat.get_name("en"),
-            french_name=cat.get_name("fr"),
-            icon=cat.icon,
-            parent_count=len(cat.parents),
-            children_count=len(cat.children)
-        )
-        for cat in categories
+    pipeline = [
+        {"$match": match},
+        {"$addFields": {
+            "name": Category.name_expr(language),
+            "parent_count": {"$size": {"$ifNull": ["$parents", []]}},
+            "children_count": {"$size": {"$ifNull": ["$children", []]}}
+        }},
+        {"$addFields": {"sort_key": {"$toLower": "$name"}}},
+        {"$sort": sort_stage},
+        {"$limit": limit},
+        {"$project": {
+            "_id": 0,
+            "off_id": 1,
+            "name": 1,
+            "english_name": Category.name_expr("en"),
+            "french_name": Category.name_expr("fr"),
+            "icon": {"$ifNull": ["$icon", None]},
+            "parent_count": 1,
+            "children_count": 1
+        }}
     ]
     
-    # Sort by requested field
-    if sort_by == "children_count":
-        category_responses.sort(key=lambda x: x.children_count, reverse=True)
-    elif sort_by == "name":
-        category_responses.sort(key=lambda x: x.name.lower())
-    elif sort_by == "off_id":
-        category_responses.sort(key=lambda x: x.off_id)
+    categories = await Category.aggregate(pipeline).to_list()
     
-    # Apply limit
-    return category_responses[:limit]
+    return ORJSONResponse(content=categories)
 
 
 @router.get("/categories/{category_id}")
@@ -106,13 +149,7 @@ async def get_category(
     """
     Get specific category details.
     """
-    category = await Category.find_one({"off_id": category_id})
-    
-    if not category:
-        try:
-            category = await Category.get(category_id)
-        except:
-            raise HTTPException(status_code=404, detail="Category not found")
+    category = await Category.find_one(_id_or_off_id_query(category_id))
     
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
@@ -150,10 +187,28 @@ async def get_stats():
     """
     Get detailed ingredient and category statistics for admin dashboard.
     """
-    total_ingredients = await Ingredient.count()
-    custom_ingredients = await Ingredient.find({"custom": True}).count()
-    total_categories = await Category.count()
-    top_level_categories = await Category.find({"parents": {"$size": 0}}).count()
+    # One round-trip per collection, both in flight at once
+    ingredient_rows, category_rows = await asyncio.gather(
+        Ingredient.aggregate([
+            {"$facet": {
+                "total": [{"$count": "n"}],
+                "custom": [{"$match": {"custom": True}}, {"$count": "n"}]
+            }}
+        ]).to_list(),
+        Category.aggregate([
+            {"$facet": {
+                "total": [{"$count": "n"}],
+                "top_level": [{"$match": {"parents": {"$size": 0}}}, {"$count": "n"}]
+            }}
+        ]).to_list()
+    )
+    ingredient_counts = ingredient_rows[0]
+    category_counts = category_rows[0]
+    
+    total_ingredients = _facet_count(ingredient_counts, "total")
+    custom_ingredients = _facet_count(ingredient_counts, "custom")
+    total_categories = _facet_count(category_counts, "total")
+    top_level_categories = _facet_count(category_counts, "top_level")
     
     return {
         "ingredients": {
@@ -169,7 +224,11 @@ async def get_stats():
 
 
 # Ingredients endpoints
-@router.get("/", response_model=PaginatedResponse)
+@router.get(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": PaginatedResponse}}
+)
 async def list_ingredients(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(50, ge=1, le=200, description="Items per page"),
@@ -186,45 +245,41 @@ async def list_ingredients(
     # Calculate skip
     skip = (page - 1) * limit
     
+    # Items are projected straight into the IngredientResponse shape so no
+    # model is built per row
+    projection = _ingredient_projection(language)
+    
     # Build query
     if search:
-        ingredients = await Ingredient.search(
+        items, total = await Ingredient.search_with_total(
             query=search,
             language=language,
             limit=limit,
-            custom_only=custom_only
+            skip=skip,
+            custom_only=custom_only,
+            projection=projection
         )
-        total = len(ingredients)
     else:
         query_filter = {"custom": True} if custom_only else {}
-        total = await Ingredient.find(query_filter).count()
-        ingredients = await Ingredient.find(query_filter).skip(skip).limit(limit).to_list()
-    
-    # Format response
-    items = [
-        IngredientResponse(
-            id=str(ing.id),
-            off_id=ing.off_id,
-            name=ing.get_name(language),
-            english_name=ing.get_name("en"),
-            french_name=ing.get_name("fr"),
-            is_vegan=ing.is_vegan(),
-            is_vegetarian=ing.is_vegetarian(),
-            custom=ing.custom,
-            wikidata_id=ing.wikidata_id
+        total, items = await asyncio.gather(
+            Ingredient.find(query_filter).count(),
+            Ingredient.aggregate([
+                {"$match": query_filter},
+                {"$skip": skip},
+                {"$limit": limit},
+                {"$project": projection}
+            ]).to_list()
         )
-        for ing in ingredients
-    ]
     
     pages = (total + limit - 1) // limit
     
-    return PaginatedResponse(
-        items=items,
-        total=total,
-        page=page,
-        limit=limit,
-        pages=pages
-    )
+    return ORJSONResponse(content={
+        "items": items,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "pages": pages
+    })
 
 
 @router.get("/search")
@@ -241,19 +296,18 @@ async def search_ingredients(
     ingredients = await Ingredient.search(
         query=q,
         language=language,
-        limit=limit
+        limit=limit,
+        projection={
+            "_id": 0,
+            "id": {"$toString": "$_id"},
+            "off_id": 1,
+            "name": Ingredient.name_expr(language),
+            "english_name": Ingredient.name_expr("en"),
+            "french_name": Ingredient.name_expr("fr")
+        }
     )
     
-    return [
-        {
-            "id": str(ing.id),
-            "off_id": ing.off_id,
-            "name": ing.get_name(language),
-            "english_name": ing.get_name("en"),
-            "french_name": ing.get_name("fr")
-        }
-        for ing in ingredients
-    ]
+    return ORJSONResponse(content=ingredients)
 
 
 @router.get("/{ingredient_id}")
@@ -266,15 +320,8 @@ async def get_ingredient(
     
     Accepts either MongoDB ObjectId or OpenFoodFacts off_id.
     """
-    # Try to find by off_id first
-    ingredient = await Ingredient.find_one({"off_id": ingredient_id})
-    
-    # If not found, try by MongoDB ID
-    if not ingredient:
-        try:
-            ingredient = await Ingredient.get(ingredient_id)
-        except:
-            raise HTTPException(status_code=404, detail="Ingredient not found")
+    # Match off_id or MongoDB ID in a single query
+    ingredient = await Ingredient.find_one(_id_or_off_id_query(ingredient_id))
     
     if not ingredient:
         raise HTTPException(status_code=404, detail="Ingredient not found")
@@ -1,18 +1,27 @@
 """
 Admin Recipes API routes
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import re
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+from typing import Dict, Iterable, List, Optional
 from pydantic import BaseModel
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
+from bson import ObjectId
+import orjson
 from app.core.database import get_db
 from app.core.security import get_current_active_admin
 from app.models.user import User
 from app.models.recipe import Recipe
 from app.models.ingredient import RecipeIngredient
-from app.models.mongodb import Ingredient  # MongoDB ingredient model
+from app.models.mongodb import Ingredient, IngredientNames  # MongoDB ingredient model
+from app.models.mongodb import Recipe as RecipeDocument
 
 router = APIRouter()
 
@@ -21,8 +30,8 @@ router = APIRouter()
 class RecipeIngredientItem(BaseModel):
     """Recipe ingredient item for requests"""
     ingredient_off_id: Optional[str] = None  # OpenFoodFacts ID like "en:tomato", optional if not linked
-    quantity: Optional[float] = None
-    quantity_max: Optional[float] = None
+    quantity: Optional[Decimal] = None  # parsed straight to the NUMERIC column type
+    quantity_max: Optional[Decimal] = None
     unit: Optional[str] = None
     preparation_notes: Optional[str] = None
     is_optional: bool = False
@@ -126,45 +135,293 @@ class RecipeListResponse(BaseModel):
         from_attributes = True
 
 
-@router.get("/recipes", response_model=List[RecipeListResponse])
+_OFF_ID_FK = "fk_recipe_ingredients_off_id"
+_OFF_ID_FK_DETAIL = re.compile(r"Key \(ingredient_off_id\)=\((.*)\) is not present")
+
+
+async def _ingredients_by_off_id(off_ids: Iterable[Optional[str]]) -> Dict[str, IngredientNames]:
+    """Fetch the MongoDB ingredients for the given off_ids (cached, one query for misses)"""
+    unique_ids = [off_id for off_id in dict.fromkeys(off_ids) if off_id]
+    if not unique_ids:
+        return {}
+    
+    return await Ingredient.get_many_by_off_id(unique_ids)
+
+
+def _unknown_ingredient_error(error: IntegrityError) -> Optional[HTTPException]:
+    """
+    Map a valid_ingredients FK violation to a 400 naming the rejected off_id.
+    
+    Postgres reports the first offending row only. Returns None for any
+    other integrity error.
+    """
+    diag = getattr(error.orig, "diag", None)
+    if getattr(diag, "constraint_name", None) != _OFF_ID_FK:
+        return None
+    match = _OFF_ID_FK_DETAIL.search(getattr(diag, "message_detail", None) or "")
+    return HTTPException(
+        status_code=400,
+        detail=f"Ingredient {match.group(1)} not found" if match else "Ingredient not found"
+    )
+
+
+def _ingredient_rows(recipe_id: UUID, items: List[RecipeIngredientItem]) -> List[dict]:
+    """Column values for a recipe's ingredient rows, in request order"""
+    return [
+        {
+            "recipe_id": recipe_id,
+            "ingredient_off_id": item.ingredient_off_id or None,  # Allow empty/null
+            "quantity": item.quantity or None,
+            "quantity_max": item.quantity_max or None,
+            "unit": item.unit,
+            "preparation_notes": item.preparation_notes,
+            "is_optional": item.is_optional,
+            "display_order": item.display_order if item.display_order is not None else idx
+        }
+        for idx, item in enumerate(items)
+    ]
+
+
+# Columns an ingredient update may change (the row is matched on
+# ingredient_off_id + display_order)
+_INGREDIENT_VALUE_COLUMNS = ("quantity", "quantity_max", "unit", "preparation_notes", "is_optional")
+
+
+def _insert_recipe_ingredients(
+    db: Session,
+    recipe_id: UUID,
+    items: List[RecipeIngredientItem]
+) -> List[RecipeIngredient]:
+    """
+    Insert a recipe's ingredient rows in one multi-row INSERT.
+    
+    RETURNING hands back the persisted rows (generated ids included), so
+    building the response needs no follow-up SELECT.
+    """
+    if not items:
+        return []
+    
+    rows = _ingredient_rows(recipe_id, items)
+    return list(db.scalars(insert(RecipeIngredient).returning(RecipeIngredient), rows))
+
+
+def _sync_recipe_ingredients(
+    db: Session,
+    recipe: Recipe,
+    items: List[RecipeIngredientItem]
+) -> List[RecipeIngredient]:
+    """
+    Make a recipe's ingredient rows match the request, writing only the
+    difference.
+    
+    Rows are matched on (ingredient_off_id, display_order): unmatched
+    existing rows are deleted, changed or new rows go through one
+    INSERT ... ON CONFLICT (id) DO UPDATE, and unchanged rows are left alone.
+    
+    Returns the resulting rows ordered by display_order.
+    """
+    existing: Dict[tuple, List[RecipeIngredient]] = {}
+    for ri in recipe.recipe_ingredients:
+        existing.setdefault((ri.ingredient_off_id, ri.display_order), []).append(ri)
+    
+    kept = []
+    upserts = []
+    for row in _ingredient_rows(recipe.id, items):
+        matches = existing.get((row["ingredient_off_id"], row["display_order"]))
+        if not matches:
+            # Give new rows their id up front so every VALUES row has the
+            # same columns
+            upserts.append({**row, "id": uuid4()})
+            continue
+        
+        current = matches.pop(0)
+        if any(getattr(current, col) != row[col] for col in _INGREDIENT_VALUE_COLUMNS):
+            upserts.append({**row, "id": current.id})
+        else:
+            kept.append(current)
+    
+    stale_ids = [ri.id for rows in existing.values() for ri in rows]
+    if stale_ids:
+        db.query(RecipeIngredient).filter(
+            RecipeIngredient.id.in_(stale_ids)
+        ).delete(synchronize_session=False)
+    
+    written = []
+    if upserts:
+        stmt = pg_insert(RecipeIngredient).values(upserts)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RecipeIngredient.id],
+            set_={col: stmt.excluded[col] for col in _INGREDIENT_VALUE_COLUMNS}
+        ).returning(RecipeIngredient)
+        written = list(db.scalars(
+            stmt,
+            execution_options={"populate_existing": True}
+        ))
+    
+    return sorted(kept + written, key=lambda ri: ri.display_order)
+
+
+def _ingredient_responses(
+    recipe_ingredients: Iterable[RecipeIngredient],
+    ingredients_by_off_id: Dict[str, IngredientNames]
+) -> List[dict]:
+    """
+    Serialize recipe_ingredients rows and their MongoDB names as
+    RecipeIngredientResponse dicts.
+    """
+    # Plain dicts straight from the DB values: no per-row model to build and
+    # dump, and each row attribute is read once
+    get_ingredient = ingredients_by_off_id.get
+    responses = []
+    for ri in recipe_ingredients:
+        off_id = ri.ingredient_off_id
+        quantity = ri.quantity
+        quantity_max = ri.quantity_max
+        ingredient = get_ingredient(off_id)
+        if ingredient:
+            name_fr = ingredient.get_name("fr")
+            name_en = ingredient.get_name("en")
+        else:
+            name_fr = name_en = None
+        responses.append({
+            "id": str(ri.id),
+            "ingredient_off_id": off_id,
+            "ingredient_name": name_fr,
+            "ingredient_name_en": name_en,
+            "ingredient_name_fr": name_fr,
+            "quantity": float(quantity) if quantity else None,
+            "quantity_max": float(quantity_max) if quantity_max else None,
+            "unit": ri.unit,
+            "preparation_notes": ri.preparation_notes,
+            "is_optional": ri.is_optional,
+            "display_order": ri.display_order
+        })
+    return responses
+
+
+def _recipe_detail_response(recipe: Recipe, ingredient_responses: List[dict]) -> ORJSONResponse:
+    """Serialize a recipe and its ingredients as a RecipeDetailResponse"""
+    return ORJSONResponse(content={
+        "id": str(recipe.id),
+        "title": recipe.title,
+        "description": recipe.description,
+        "servings": recipe.servings,
+        "prep_time": recipe.prep_time,
+        "cook_time": recipe.cook_time,
+        "total_time": recipe.total_time,
+        "category": recipe.category,
+        "cuisine": recipe.cuisine,
+        "difficulty_level": recipe.difficulty_level,
+        "temperature": recipe.temperature,
+        "temperature_unit": recipe.temperature_unit,
+        "instructions": recipe.instructions,
+        "notes": recipe.notes,
+        "is_public": recipe.is_public,
+        "ingredients": ingredient_responses,
+        "equipment": recipe.equipment
+    })
+
+
+# Recipes live in MongoDB; fields read by list_all_recipes
+_RECIPE_LIST_PROJECTION = {
+    "title": 1,
+    "description": 1,
+    "category": 1,
+    "cuisine": 1,
+    "servings": 1,
+    "total_time": 1,
+    "is_public": 1
+}
+
+
+@router.get(
+    "/recipes",
+    response_class=StreamingResponse,
+    responses={200: {
+        "model": List[RecipeListResponse],
+        "content": {"application/json": {}}
+    }}
+)
 async def list_all_recipes(
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor instead; ignored with a cursor"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor: the X-Next-Cursor header of the previous page"
+    ),
     current_user: User = Depends(get_current_active_admin)
 ):
-    """List all recipes (admin view - includes private recipes)"""
-    from motor.motor_asyncio import AsyncIOMotorClient
-    from app.core.config import settings
+    """
+    List all recipes (admin view - includes private recipes)
     
-    # Direct MongoDB connection
-    mongo_url = getattr(settings, 'MONGODB_URL', 'mongodb://localhost:27017')
-    client = AsyncIOMotorClient(mongo_url)
-    db_name = getattr(settings, 'MONGODB_DB_NAME', 'legrimoire')
-    db = client[db_name]
+    Newest first. When a full page is returned, the X-Next-Cursor response
+    header holds the cursor for the next one.
+    """
+    # Keyset pagination on _id (ObjectIds grow with insertion time), so
+    # later pages seek instead of skipping rows
+    query = {}
+    if cursor:
+        if not ObjectId.is_valid(cursor):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        query["_id"] = {"$lt": ObjectId(cursor)}
+        skip = 0  # the cursor already positions the page
     
-    try:
-        # Get all recipes (including private ones for admin)
-        cursor = db.recipes.find({}).skip(skip).limit(limit)
-        raw_recipes = await cursor.to_list(length=limit)
-    finally:
-        client.close()
+    # The app's shared MongoDB client, so nothing is opened per request or
+    # left to close if the body is never streamed
+    recipes_collection = RecipeDocument.get_pymongo_collection()
     
-    return [
-        RecipeListResponse(
-            id=str(recipe["_id"]),
-            title=recipe.get("title", ""),
-            description=recipe.get("description", ""),
-            category=recipe.get("category", ""),
-            cuisine=recipe.get("cuisine", ""),
-            servings=recipe.get("servings"),
-            total_time=recipe.get("total_time"),
-            is_public=recipe.get("is_public", True)
-        )
-        for recipe in raw_recipes
+    # Headers are sent before the body, so read the page's _ids first (from
+    # the _id index only): the streamed page is exactly these recipes and
+    # the next cursor is the last of them
+    page_ids = [
+        recipe["_id"]
+        for recipe in await recipes_collection.find(query, {"_id": 1}).sort(
+            "_id", -1
+        ).skip(skip).limit(limit).to_list(length=limit)
     ]
+    
+    headers = {}
+    if len(page_ids) == limit:
+        headers["X-Next-Cursor"] = str(page_ids[-1])
+    
+    async def stream_recipes():
+        # Emit a JSON array one recipe at a time instead of buffering the
+        # page, so large exports are never held in memory twice. The page's
+        # recipes (including private ones for admin), newest first, with
+        # only the fields the list view shows
+        recipes = recipes_collection.find(
+            {"_id": {"$in": page_ids}},
+            _RECIPE_LIST_PROJECTION
+        ).sort("_id", -1)
+        try:
+            yield b"["
+            first = True
+            async for recipe in recipes:
+                if not first:
+                    yield b","
+                first = False
+                yield orjson.dumps({
+                    "id": str(recipe["_id"]),
+                    "title": recipe.get("title", ""),
+                    "description": recipe.get("description", ""),
+                    "category": recipe.get("category", ""),
+                    "cuisine": recipe.get("cuisine", ""),
+                    "servings": recipe.get("servings"),
+                    "total_time": recipe.get("total_time"),
+                    "is_public": recipe.get("is_public", True)
+                })
+            yield b"]"
+        finally:
+            await recipes.close()
+    
+    return StreamingResponse(stream_recipes(), headers=headers, media_type="application/json")
 
 
-@router.post("/recipes", response_model=RecipeDetailResponse)
+@router.post(
+    "/recipes",
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecipeDetailResponse}}
+)
 async def create_recipe(
     recipe_data: RecipeCreateRequest,
     current_user: User = Depends(get_current_active_admin),
@@ -192,168 +449,97 @@ async def create_recipe(
         equipment=recipe_data.equipment
     )
     
+    # Stub recipe without ingredients: no rows to insert or names to fetch
+    if not recipe_data.ingredients:
+        db.add(new_recipe)
+        db.flush()  # Assign the recipe ID
+        response = _recipe_detail_response(new_recipe, [])
+        db.commit()
+        return response
+    
+    # Names for the response come from MongoDB; unknown off_ids are
+    # rejected by the valid_ingredients FK on insert
+    ingredients_by_off_id = await _ingredients_by_off_id(
+        item.ingredient_off_id for item in recipe_data.ingredients
+    )
+    
     db.add(new_recipe)
     db.flush()  # Get the recipe ID without committing
+    try:
+        recipe_ingredients = _insert_recipe_ingredients(db, new_recipe.id, recipe_data.ingredients)
+    except IntegrityError as e:
+        db.rollback()
+        raise _unknown_ingredient_error(e) or e
     
-    # Add recipe ingredients
-    recipe_ingredients = []
-    for idx, ing_data in enumerate(recipe_data.ingredients):
-        # Verify ingredient exists in MongoDB (only if ingredient_off_id is provided)
-        if ing_data.ingredient_off_id:
-            ingredient = await Ingredient.find_one({"off_id": ing_data.ingredient_off_id})
-            
-            if not ingredient:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Ingredient {ing_data.ingredient_off_id} not found"
-                )
-        
-        recipe_ingredient = RecipeIngredient(
-            recipe_id=new_recipe.id,
-            ingredient_off_id=ing_data.ingredient_off_id or None,  # Allow empty/null
-            quantity=Decimal(str(ing_data.quantity)) if ing_data.quantity else None,
-            quantity_max=Decimal(str(ing_data.quantity_max)) if ing_data.quantity_max else None,
-            unit=ing_data.unit,
-            preparation_notes=ing_data.preparation_notes,
-            is_optional=ing_data.is_optional,
-            display_order=ing_data.display_order if ing_data.display_order is not None else idx
-        )
-        
-        db.add(recipe_ingredient)
-        recipe_ingredients.append(recipe_ingredient)
+    # Build the response from the in-memory objects before commit expires
+    # them, so no reload is needed
+    ingredient_responses = _ingredient_responses(recipe_ingredients, ingredients_by_off_id)
+    response = _recipe_detail_response(new_recipe, ingredient_responses)
     
     db.commit()
-    db.refresh(new_recipe)
     
-    # Build response
-    ingredient_responses = []
-    for ri in recipe_ingredients:
-        db.refresh(ri)
-        # Fetch ingredient from MongoDB (only if off_id is provided)
-        ingredient = None
-        if ri.ingredient_off_id:
-            ingredient = await Ingredient.find_one({"off_id": ri.ingredient_off_id})
-        
-        ingredient_responses.append(RecipeIngredientResponse(
-            id=str(ri.id),
-            ingredient_off_id=ri.ingredient_off_id,
-            ingredient_name=ingredient.get_name("fr") if ingredient else None,
-            ingredient_name_en=ingredient.get_name("en") if ingredient else None,
-            ingredient_name_fr=ingredient.get_name("fr") if ingredient else None,
-            quantity=float(ri.quantity) if ri.quantity else None,
-            quantity_max=float(ri.quantity_max) if ri.quantity_max else None,
-            unit=ri.unit,
-            preparation_notes=ri.preparation_notes,
-            is_optional=ri.is_optional,
-            display_order=ri.display_order
-        ))
-    
-    return RecipeDetailResponse(
-        id=str(new_recipe.id),
-        title=new_recipe.title,
-        description=new_recipe.description,
-        servings=new_recipe.servings,
-        prep_time=new_recipe.prep_time,
-        cook_time=new_recipe.cook_time,
-        total_time=new_recipe.total_time,
-        category=new_recipe.category,
-        cuisine=new_recipe.cuisine,
-        difficulty_level=new_recipe.difficulty_level,
-        temperature=new_recipe.temperature,
-        temperature_unit=new_recipe.temperature_unit,
-        instructions=new_recipe.instructions,
-        notes=new_recipe.notes,
-        is_public=new_recipe.is_public,
-        ingredients=ingredient_responses,
-        equipment=new_recipe.equipment
-    )
+    return response
 
 
-@router.get("/recipes/{recipe_id}", response_model=RecipeDetailResponse)
+@router.get(
+    "/recipes/{recipe_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecipeDetailResponse}}
+)
 async def get_admin_recipe(
     recipe_id: UUID,
     current_user: User = Depends(get_current_active_admin),
     db: Session = Depends(get_db)
 ):
     """Get recipe details with structured ingredients for admin"""
-    recipe = db.query(Recipe).filter(Recipe.id == recipe_id).first()
+    # Load the recipe_ingredients rows along with the recipe
+    recipe = db.query(Recipe).options(
+        selectinload(Recipe.recipe_ingredients)
+    ).filter(Recipe.id == recipe_id).first()
     
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
     
-    # Get recipe ingredients from recipe_ingredients table
-    recipe_ingredients = db.query(RecipeIngredient).filter(
-        RecipeIngredient.recipe_id == recipe_id
-    ).order_by(RecipeIngredient.display_order).all()
+    recipe_ingredients = recipe.recipe_ingredients
     
     # Build ingredient responses with MongoDB data
     ingredient_responses = []
     
     # Check if we have structured ingredients, otherwise use legacy text array
     if recipe_ingredients:
-        # New format: structured ingredients from recipe_ingredients table
-        for ri in recipe_ingredients:
-            # Fetch ingredient from MongoDB (only if off_id is provided)
-            ingredient = None
-            if ri.ingredient_off_id:
-                ingredient = await Ingredient.find_one({"off_id": ri.ingredient_off_id})
-            
-            ingredient_responses.append(
-                RecipeIngredientResponse(
-                    id=str(ri.id),
-                    ingredient_off_id=ri.ingredient_off_id,
-                    ingredient_name=ingredient.get_name("fr") if ingredient else None,
-                    ingredient_name_en=ingredient.get_name("en") if ingredient else None,
-                    ingredient_name_fr=ingredient.get_name("fr") if ingredient else None,
-                    quantity=float(ri.quantity) if ri.quantity else None,
-                    quantity_max=float(ri.quantity_max) if ri.quantity_max else None,
-                    unit=ri.unit,
-                    preparation_notes=ri.preparation_notes,
-                    is_optional=ri.is_optional,
-                    display_order=ri.display_order
-                )
-            )
+        # New format: structured ingredients from recipe_ingredients table,
+        # with their MongoDB ingredients fetched in one query
+        ingredients_by_off_id = await _ingredients_by_off_id(
+            ri.ingredient_off_id for ri in recipe_ingredients
+        )
+        ingredient_responses = _ingredient_responses(recipe_ingredients, ingredients_by_off_id)
     elif recipe.ingredients:
         # Legacy format: text array in recipes.ingredients column
-        for idx, ing_text in enumerate(recipe.ingredients):
-            ingredient_responses.append(
-                RecipeIngredientResponse(
-                    id=f"legacy-{idx}",
-                    ingredient_off_id="",
-                    ingredient_name=ing_text,
-                    ingredient_name_en=ing_text,
-                    ingredient_name_fr=ing_text,
-                    quantity=None,
-                    quantity_max=None,
-                    unit=None,
-                    preparation_notes=ing_text,  # Store full text here
-                    is_optional=False,
-                    display_order=idx
-                )
-            )
-    
-    return RecipeDetailResponse(
-        id=str(recipe.id),
-        title=recipe.title,
-        description=recipe.description,
-        servings=recipe.servings,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        total_time=recipe.total_time,
-        category=recipe.category,
-        cuisine=recipe.cuisine,
-        difficulty_level=recipe.difficulty_level,
-        temperature=recipe.temperature,
-        temperature_unit=recipe.temperature_unit,
-        instructions=recipe.instructions,
-        notes=recipe.notes,
-        is_public=recipe.is_public,
-        ingredients=ingredient_responses,
-        equipment=recipe.equipment
-    )
+        ingredient_responses = [
+            {
+                "id": f"legacy-{idx}",
+                "ingredient_off_id": "",
+                "ingredient_name": ing_text,
+                "ingredient_name_en": ing_text,
+                "ingredient_name_fr": ing_text,
+                "quantity": None,
+                "quantity_max": None,
+                "unit": None,
+                "preparation_notes": ing_text,  # Store full text here
+                "is_optional": False,
+                "display_order": idx
+            }
+            for idx, ing_text in enumerate(recipe.ingredients)
+        ]
+    
+    return _recipe_detail_response(recipe, ingredient_responses)
 
 
-@router.put("/recipes/{recipe_id}", response_model=RecipeDetailResponse)
+@router.put(
+    "/recipes/{recipe_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": RecipeDetailResponse}}
+)
 async def update_recipe(
     recipe_id: UUID,
     recipe_data: RecipeUpdateRequest,
@@ -366,121 +552,44 @@ async def update_recipe(
     if not recipe:
         raise HTTPException(status_code=404, detail="Recipe not found")
     
-    # Update recipe fields
-    if recipe_data.title is not None:
-        recipe.title = recipe_data.title
-    if recipe_data.description is not None:
-        recipe.description = recipe_data.description
-    if recipe_data.servings is not None:
-        recipe.servings = recipe_data.servings
-    if recipe_data.prep_time is not None:
-        recipe.prep_time = recipe_data.prep_time
-    if recipe_data.cook_time is not None:
-        recipe.cook_time = recipe_data.cook_time
-    if recipe_data.total_time is not None:
-        recipe.total_time = recipe_data.total_time
-    if recipe_data.category is not None:
-        recipe.category = recipe_data.category
-    if recipe_data.cuisine is not None:
-        recipe.cuisine = recipe_data.cuisine
-    if recipe_data.difficulty_level is not None:
-        recipe.difficulty_level = recipe_data.difficulty_level
-    if recipe_data.temperature is not None:
-        recipe.temperature = recipe_data.temperature
-    if recipe_data.temperature_unit is not None:
-        recipe.temperature_unit = recipe_data.temperature_unit
-    if recipe_data.instructions is not None:
-        recipe.instructions = recipe_data.instructions
-    if recipe_data.notes is not None:
-        recipe.notes = recipe_data.notes
-    if recipe_data.is_public is not None:
-        recipe.is_public = recipe_data.is_public
-    if recipe_data.equipment is not None:
-        recipe.equipment = recipe_data.equipment
+    # Update only the fields that were sent, in a single UPDATE; "evaluate"
+    # applies the same values to the loaded recipe for the response
+    changes = recipe_data.model_dump(
+        exclude_unset=True,
+        exclude_none=True,
+        exclude={"ingredients"}
+    )
+    if changes:
+        db.query(Recipe).filter(Recipe.id == recipe_id).update(
+            changes,
+            synchronize_session="evaluate"
+        )
     
     # Update ingredients if provided
     if recipe_data.ingredients is not None:
-        # Remove existing recipe ingredients
-        db.query(RecipeIngredient).filter(
-            RecipeIngredient.recipe_id == recipe_id
-        ).delete()
-        
-        # Add new recipe ingredients
-        for idx, ing_data in enumerate(recipe_data.ingredients):
-            # Verify ingredient exists in MongoDB (only if ingredient_off_id is provided)
-            if ing_data.ingredient_off_id:
-                ingredient = await Ingredient.find_one({"off_id": ing_data.ingredient_off_id})
-                
-                if not ingredient:
-                    raise HTTPException(
-                        status_code=400,
-                        detail=f"Ingredient {ing_data.ingredient_off_id} not found"
-                    )
-            
-            recipe_ingredient = RecipeIngredient(
-                recipe_id=recipe_id,
-                ingredient_off_id=ing_data.ingredient_off_id or None,  # Allow empty/null
-                quantity=Decimal(str(ing_data.quantity)) if ing_data.quantity else None,
-                quantity_max=Decimal(str(ing_data.quantity_max)) if ing_data.quantity_max else None,
-                unit=ing_data.unit,
-                preparation_notes=ing_data.preparation_notes,
-                is_optional=ing_data.is_optional,
-                display_order=ing_data.display_order if ing_data.display_order is not None else idx
-            )
-            
-            db.add(recipe_ingredient)
-    
-    db.commit()
-    db.refresh(recipe)
+        # Only write the rows that were added, changed or removed; unknown
+        # off_ids are rejected by the valid_ingredients FK
+        try:
+            recipe_ingredients = _sync_recipe_ingredients(db, recipe, recipe_data.ingredients)
+        except IntegrityError as e:
+            db.rollback()
+            raise _unknown_ingredient_error(e) or e
+    else:
+        recipe_ingredients = recipe.recipe_ingredients
+    ingredients_by_off_id = await _ingredients_by_off_id(
+        ri.ingredient_off_id for ri in recipe_ingredients
+    )
     
-    # Get updated ingredients
-    recipe_ingredients = db.query(RecipeIngredient).filter(
-        RecipeIngredient.recipe_id == recipe_id
-    ).order_by(RecipeIngredient.display_order).all()
+    # Build the response from the in-memory objects before commit expires
+    # them, so nothing is reloaded afterwards
+    ingredient_responses = _ingredient_responses(recipe_ingredients, ingredients_by_off_id)
+    response = _recipe_detail_response(recipe, ingredient_responses)
     
-    # Build ingredient responses with MongoDB data
-    ingredient_responses = []
-    for ri in recipe_ingredients:
-        # Fetch ingredient from MongoDB (only if off_id is provided)
-        ingredient = None
-        if ri.ingredient_off_id:
-            ingredient = await Ingredient.find_one({"off_id": ri.ingredient_off_id})
-        
-        ingredient_responses.append(
-            RecipeIngredientResponse(
-                id=str(ri.id),
-                ingredient_off_id=ri.ingredient_off_id,
-                ingredient_name=ingredient.get_name("fr") if ingredient else None,
-                ingredient_name_en=ingredient.get_name("en") if ingredient else None,
-                ingredient_name_fr=ingredient.get_name("fr") if ingredient else None,
-                quantity=float(ri.quantity) if ri.quantity else None,
-                quantity_max=float(ri.quantity_max) if ri.quantity_max else None,
-                unit=ri.unit,
-                preparation_notes=ri.preparation_notes,
-                is_optional=ri.is_optional,
-                display_order=ri.display_order
-            )
-        )
+    # Nothing was written for an empty update, so there is nothing to commit
+    if changes or recipe_data.ingredients is not None:
+        db.commit()
     
-    return RecipeDetailResponse(
-        id=str(recipe.id),
-        title=recipe.title,
-        description=recipe.description,
-        servings=recipe.servings,
-        prep_time=recipe.prep_time,
-        cook_time=recipe.cook_time,
-        total_time=recipe.total_time,
-        category=recipe.category,
-        cuisine=recipe.cuisine,
-        difficulty_level=recipe.difficulty_level,
-        temperature=recipe.temperature,
-        temperature_unit=recipe.temperature_unit,
-        instructions=recipe.instructions,
-        notes=recipe.notes,
-        is_public=recipe.is_public,
-        ingredients=ingredient_responses,
-        equipment=recipe.equipment
-    )
+    return response
 
 
 @router.delete("/recipes/{recipe_id}")
@@ -491,7 +600,6 @@ async def delete_recipe(
     """Delete a recipe from MongoDB"""
     from motor.motor_asyncio import AsyncIOMotorClient
     from app.core.config import settings
-    from bson import ObjectId
     
     # Direct MongoDB connection
     mongo_url = getattr(settings, 'MONGODB_URL', 'mongodb://localhost:27017')
@@ -1,17 +1,24 @@
 """
 Admin user management API routes
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 from app.core.database import get_db
-from app.core.security import get_current_active_admin, get_password_hash
+from app.core.security import duplicate_user_detail, get_current_active_admin, get_password_hash
 from app.models.user import User, UserRole
 
 router = APIRouter()
 
+_VALID_ROLES = frozenset(r.value for r in UserRole)
+_VALID_ROLES_STR = ", ".join(r.value for r in UserRole)
+
 
 class UserListResponse(BaseModel):
     """User list response"""
@@ -22,7 +29,7 @@ class UserListResponse(BaseModel):
     is_active: bool
     name: Optional[str] = None
     oauth_provider: Optional[str] = None
-    created_at: str
+    created_at: datetime
 
 
 class UserDetailResponse(BaseModel):
@@ -36,8 +43,8 @@ class UserDetailResponse(BaseModel):
     avatar_url: Optional[str] = None
     oauth_provider: Optional[str] = None
     oauth_provider_id: Optional[str] = None
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
 
 class UserUpdateRequest(BaseModel):
@@ -62,10 +69,58 @@ class UserCreateRequest(BaseModel):
     is_active: bool = True
 
 
-@router.get("/", response_model=List[UserListResponse])
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_user_cursor(created_at: datetime, user_id: UUID) -> str:
+    """URL-safe "<created_at epoch microseconds>_<id hex>" keyset cursor"""
+    return f"{(created_at - _EPOCH) // _MICROSECOND}_{user_id.hex}"
+
+
+def _decode_user_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor made by _encode_user_cursor"""
+    try:
+        micros, user_id = cursor.split("_", 1)
+        return _EPOCH + int(micros) * _MICROSECOND, UUID(hex=user_id)
+    except (ValueError, OverflowError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def _user_detail_response(user: User) -> ORJSONResponse:
+    """Serialize a user in the UserDetailResponse shape"""
+    # Values come straight from the DB, so no model is built or validated;
+    # datetimes are left for orjson to format
+    return ORJSONResponse(content={
+        "id": str(user.id),
+        "email": user.email,
+        "username": user.username,
+        "role": user.role,
+        "is_active": user.is_active,
+        "name": user.name,
+        "avatar_url": user.avatar_url,
+        "oauth_provider": user.oauth_provider,
+        "oauth_provider_id": user.oauth_provider_id,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at
+    })
+
+
+@router.get(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[UserListResponse]}}
+)
 async def list_users(
-    skip: int = 0,
-    limit: int = 50,
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor instead; ignored with a cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor: the X-Next-Cursor header of the previous page"
+    ),
     search: Optional[str] = None,
     role: Optional[str] = None,
     is_active: Optional[bool] = None,
@@ -74,8 +129,21 @@ async def list_users(
 ):
     """
     List all users (admin only)
+    
+    Newest first. When a full page is returned, the X-Next-Cursor response
+    header holds the cursor for the next one.
     """
-    query = db.query(User)
+    # Select only the listed columns (plain rows, no ORM instances)
+    query = db.query(
+        User.id,
+        User.email,
+        User.username,
+        User.role,
+        User.is_active,
+        User.name,
+        User.oauth_provider,
+        User.created_at
+    )
     
     if search:
         query = query.filter(
@@ -89,24 +157,44 @@ async def list_users(
     if is_active is not None:
         query = query.filter(User.is_active == is_active)
     
-    users = query.order_by(User.created_at.desc()).offset(skip).limit(limit).all()
-    
-    return [
-        UserListResponse(
-            id=str(user.id),
-            email=user.email,
-            username=user.username,
-            role=user.role,
-            is_active=user.is_active,
-            name=user.name,
-            oauth_provider=user.oauth_provider,
-            created_at=user.created_at.isoformat()
+    # Keyset pagination: seek past the cursor row instead of OFFSET-scanning.
+    # The cursor already positions the page, so skip is not applied on top
+    if cursor:
+        query = query.filter(
+            tuple_(User.created_at, User.id) < _decode_user_cursor(cursor)
         )
+        skip = 0
+    
+    users = query.order_by(
+        User.created_at.desc(),
+        User.id.desc()
+    ).offset(skip).limit(limit).all()
+    
+    headers = {}
+    if len(users) == limit:
+        last = users[-1]
+        headers["X-Next-Cursor"] = _encode_user_cursor(last.created_at, last.id)
+    
+    return ORJSONResponse(headers=headers, content=[
+        {
+            "id": str(user.id),
+            "email": user.email,
+            "username": user.username,
+            "role": user.role,
+            "is_active": user.is_active,
+            "name": user.name,
+            "oauth_provider": user.oauth_provider,
+            "created_at": user.created_at
+        }
         for user in users
-    ]
+    ])
 
 
-@router.get("/{user_id}", response_model=UserDetailResponse)
+@router.get(
+    "/{user_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserDetailResponse}}
+)
 async def get_user(
     user_id: UUID,
     current_user: User = Depends(get_current_active_admin),
@@ -123,22 +211,14 @@ async def get_user(
             detail="User not found"
         )
     
-    return UserDetailResponse(
-        id=str(user.id),
-        email=user.email,
-        username=user.username,
-        role=user.role,
-        is_active=user.is_active,
-        name=user.name,
-        avatar_url=user.avatar_url,
-        oauth_provider=user.oauth_provider,
-        oauth_provider_id=user.oauth_provider_id,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
-    )
+    return _user_detail_response(user)
 
 
-@router.post("/", response_model=UserDetailResponse)
+@router.post(
+    "/",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserDetailResponse}}
+)
 async def create_user(
     request: UserCreateRequest,
     current_user: User = Depends(get_current_active_admin),
@@ -147,31 +227,13 @@ async def create_user(
     """
     Create a new user (admin only)
     """
-    # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == request.email) | (User.username == request.username)
-    ).first()
-    
-    if existing_user:
-        if existing_user.email == request.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
-            )
-    
     # Validate role
-    try:
-        user_role = UserRole(request.role)
-    except ValueError:
+    if request.role not in _VALID_ROLES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role. Must be one of: {', '.join([r.value for r in UserRole])}"
+            detail=f"Invalid role. Must be one of: {_VALID_ROLES_STR}"
         )
+    user_role = UserRole(request.role)
     
     # Create user
     password_hash = get_password_hash(request.password) if request.password else None
@@ -183,25 +245,28 @@ async def create_user(
         is_active=request.is_active
     )
     db.add(user)
-    db.commit()
+    # Let the unique indexes reject duplicates instead of checking first
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        detail = duplicate_user_detail(e)
+        if detail is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
     db.refresh(user)
     
-    return UserDetailResponse(
-        id=str(user.id),
-        email=user.email,
-        username=user.username,
-        role=user.role,
-        is_active=user.is_active,
-        name=user.name,
-        avatar_url=user.avatar_url,
-        oauth_provider=user.oauth_provider,
-        oauth_provider_id=user.oauth_provider_id,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
-    )
+    return _user_detail_response(user)
 
 
-@router.put("/{user_id}", response_model=UserDetailResponse)
+@router.put(
+    "/{user_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserDetailResponse}}
+)
 async def update_user(
     user_id: UUID,
     request: UserUpdateRequest,
@@ -219,58 +284,37 @@ async def update_user(
             detail="User not found"
         )
     
-    # Update fields
-    if request.email is not None:
-        # Check if email is already taken
-        existing = db.query(User).filter(
-            User.email == request.email,
-            User.id != user_id
-        ).first()
-        if existing:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        user.email = request.email
+    changes = request.model_dump(exclude_unset=True, exclude_none=True)
     
-    if request.username is not None:
-        # Check if username is already taken
-        existing = db.query(User).filter(
-            User.username == request.username,
-            User.id != user_id
-        ).first()
-        if existing:
+    # Update only the fields that were sent, in a single UPDATE; the unique
+    # indexes reject a taken email/username
+    if changes:
+        try:
+            db.query(User).filter(User.id == user_id).update(
+                changes,
+                synchronize_session="evaluate"
+            )
+        except IntegrityError as e:
+            db.rollback()
+            detail = duplicate_user_detail(e)
+            if detail is None:
+                raise
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
+                detail=detail
             )
-        user.username = request.username
-    
-    if request.name is not None:
-        user.name = request.name
-    
-    if request.is_active is not None:
-        user.is_active = request.is_active
     
     db.commit()
-    db.refresh(user)
+    db.refresh(user)  # updated_at is set by the DB trigger
     
-    return UserDetailResponse(
-        id=str(user.id),
-        email=user.email,
-        username=user.username,
-        role=user.role,
-        is_active=user.is_active,
-        name=user.name,
-        avatar_url=user.avatar_url,
-        oauth_provider=user.oauth_provider,
-        oauth_provider_id=user.oauth_provider_id,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
-    )
+    return _user_detail_response(user)
 
 
-@router.put("/{user_id}/role", response_model=UserDetailResponse)
+@router.put(
+    "/{user_id}/role",
+    response_class=ORJSONResponse,
+    responses={200: {"model": UserDetailResponse}}
+)
 async def update_user_role(
     user_id: UUID,
     request: UserRoleUpdateRequest,
@@ -289,31 +333,18 @@ async def update_user_role(
         )
     
     # Validate role
-    try:
-        user_role = UserRole(request.role)
-    except ValueError:
+    if request.role not in _VALID_ROLES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid role. Must be one of: {', '.join([r.value for r in UserRole])}"
+            detail=f"Invalid role. Must be one of: {_VALID_ROLES_STR}"
         )
+    user_role = UserRole(request.role)
     
     user.role = user_role
     db.commit()
     db.refresh(user)
     
-    return UserDetailResponse(
-        id=str(user.id),
-        email=user.email,
-        username=user.username,
-        role=user.role,
-        is_active=user.is_active,
-        name=user.name,
-        avatar_url=user.avatar_url,
-        oauth_provider=user.oauth_provider,
-        oauth_provider_id=user.oauth_provider_id,
-        created_at=user.created_at.isoformat(),
-        updated_at=user.updated_at.isoformat()
-    )
+    return _user_detail_response(user)
 
 
 @router.delete("/{user_id}")
@@ -2,17 +2,33 @@
 Admin API for managing wine database (metadata/master wines list)
 Separate from user's personal cellier inventory
 """
-from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
-from typing import List, Optional
-from pydantic import BaseModel
-from datetime import datetime
-import uuid
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Depends, UploadFile, File, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse, Response
+from typing import Any, Dict, List, Optional, Tuple
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime, UTC
+import hashlib
+import logging
+import operator
+import re
+import time
+from collections import OrderedDict
 from pathlib import Path
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+import orjson
+from PIL import Image
 from app.models.mongodb import Wine
 from app.models.mongodb.wine import GrapeVariety
 from app.core.security import get_current_user
 from app.models.user import User, UserRole
 from app.core.config import settings
+from app.services.uploads import unique_image_filename
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
@@ -29,6 +45,8 @@ def require_admin(current_user: User = Depends(get_current_user)):
 
 class AdminWineResponse(BaseModel):
     """Admin wine response model"""
+    model_config = ConfigDict(defer_build=False, from_attributes=True)
+    
     id: str
     name: str
     producer: Optional[str]
@@ -38,21 +56,34 @@ class AdminWineResponse(BaseModel):
     country: str
     appellation: Optional[str] = None
     alcohol_content: Optional[float] = None
-    grape_varieties: List[GrapeVariety] = []
+    grape_varieties: List[GrapeVariety] = Field(default_factory=list)
     tasting_notes: str = ""
-    food_pairings: List[str] = []
+    food_pairings: List[str] = Field(default_factory=list)
     is_public: bool
     data_source: str
     barcode: Optional[str] = None
     created_at: datetime
     updated_at: datetime
+
+
+class BulkCreateError(BaseModel):
+    """A wine rejected by a bulk create"""
+    index: int
+    detail: str
+
+
+class BulkCreateResponse(BaseModel):
+    """Bulk create result"""
+    model_config = ConfigDict(defer_build=False)
     
-    class Config:
-        from_attributes = True
+    inserted_ids: List[str]
+    errors: List[BulkCreateError] = Field(default_factory=list)
 
 
 class AdminWineCreate(BaseModel):
     """Admin wine creation (master database)"""
+    model_config = ConfigDict(defer_build=False)
+    
     name: str
     producer: Optional[str] = None
     vintage: Optional[int] = None
@@ -61,17 +92,17 @@ class AdminWineCreate(BaseModel):
     region: str = ""
     appellation: Optional[str] = None
     classification: Optional[str] = None
-    grape_varieties: List[GrapeVariety] = []
+    grape_varieties: List[GrapeVariety] = Field(default_factory=list)
     alcohol_content: Optional[float] = None
     body: Optional[str] = None
     sweetness: Optional[str] = None
     acidity: Optional[str] = None
     tannins: Optional[str] = None
     color: str = ""
-    nose: List[str] = []
-    palate: List[str] = []
+    nose: List[str] = Field(default_factory=list)
+    palate: List[str] = Field(default_factory=list)
     tasting_notes: str = ""
-    food_pairings: List[str] = []
+    food_pairings: List[str] = Field(default_factory=list)
     image_url: Optional[str] = None
     barcode: Optional[str] = None
     is_public: bool = True  # Master wines are public by default
@@ -79,6 +110,8 @@ class AdminWineCreate(BaseModel):
 
 class AdminWineUpdate(BaseModel):
     """Admin wine update"""
+    model_config = ConfigDict(defer_build=False)
+    
     name: Optional[str] = None
     producer: Optional[str] = None
     vintage: Optional[int] = None
@@ -103,22 +136,207 @@ class AdminWineUpdate(BaseModel):
     is_public: Optional[bool] = None
 
 
-@router.get("/wines", response_model=List[AdminWineResponse])
+# Wine attributes copied as-is into AdminWineResponse (everything but id),
+# fetched in one C-level attrgetter call
+_ADMIN_WINE_FIELDS: Tuple[str, ...] = tuple(
+    field for field in AdminWineResponse.model_fields if field != "id"
+)
+_admin_wine_attrs = operator.attrgetter(*_ADMIN_WINE_FIELDS)
+
+
+def _wine_to_response(wine: Wine) -> Dict[str, Any]:
+    """AdminWineResponse-shaped dict for a Wine document (no model built)"""
+    response = dict(zip(_ADMIN_WINE_FIELDS, _admin_wine_attrs(wine)))
+    response["id"] = str(wine.id)
+    response["grape_varieties"] = [grape.model_dump() for grape in wine.grape_varieties]
+    return response
+
+
+def _now() -> datetime:
+    """Timezone-aware UTC timestamp for created_at/updated_at"""
+    return datetime.now(UTC)
+
+
+def _new_master_wine(wine_data: AdminWineCreate) -> Wine:
+    """Build (and validate) a master Wine with a pre-assigned _id"""
+    now = _now()
+    wine = Wine(
+        **wine_data.model_dump(),
+        id=ObjectId(),
+        user_id=None,  # Master wines have no user
+        current_quantity=0,  # Master wines don't have inventory
+        data_source="admin",
+        created_at=now,
+        updated_at=now
+    )
+    # Inserted straight into the collection, so run the insert hook here
+    wine.set_search_fields()
+    return wine
+
+
+def _insert_document(wine: Wine) -> Dict[str, Any]:
+    """
+    Raw document for a direct collection insert
+    
+    Master wines are written straight to the collection (no Beanie insert
+    hooks), so batches go out in a single insert_many.
+    """
+    document = wine.model_dump(exclude={"id", "revision_id"})
+    document["_id"] = wine.id
+    return document
+
+
+def _duplicate_barcode_error() -> HTTPException:
+    """409 for a barcode already used by another master wine"""
+    return HTTPException(
+        status_code=409,
+        detail="A master wine with this barcode already exists"
+    )
+
+
+def _safe_prefix(term: str) -> Dict[str, str]:
+    """
+    Prefix match on a literal term (never a user regex) for the lowercased
+    name_lower/producer_lower fields; anchored and case-sensitive, so the
+    index bounds the scan
+    """
+    return {"$regex": f"^{re.escape(term.lower())}"}
+
+
+def _plain_text_search(term: str) -> str:
+    """Drop $text phrase quotes and negations so the search is plain words"""
+    return " ".join(word.lstrip("-") for word in term.replace('"', " ").split())
+
+
+def _decode_score_cursor(cursor: str) -> Tuple[float, ObjectId]:
+    """Decode a "<text score>_<id>" keyset cursor"""
+    score, _, last_id = cursor.rpartition("_")
+    try:
+        return float(score), ObjectId(last_id)
+    except (ValueError, InvalidId):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _object_id_or_404(wine_id: str, detail: str) -> ObjectId:
+    """Parse a wine id, answering 404 for malformed ids without querying"""
+    if not ObjectId.is_valid(wine_id):
+        raise HTTPException(status_code=404, detail=detail)
+    return ObjectId(wine_id)
+
+
+def _master_wine_filter(wine_id: str) -> Dict[str, Any]:
+    """Match a master wine (no user_id) by id; 404 for malformed ids"""
+    return {"_id": _object_id_or_404(wine_id, "Master wine not found"), "user_id": None}
+
+
+# In-process caches for the hot master wine reads. A write through this API
+# clears them only in the worker that handled it; with several workers
+# (docker-compose.prod.yml defaults to 4) the other workers, like writes
+# made elsewhere, are bounded by the TTLs, so a response and its ETag may
+# be up to a minute old.
+_WINE_CACHE_TTL = 60.0  # seconds
+_WINE_CACHE_MAXSIZE = 4096
+_STATS_CACHE_TTL = 60.0  # seconds
+# ("id", wine_id) / ("barcode", barcode) -> (expires, etag, JSON body)
+_wine_cache: "OrderedDict[Tuple[str, str], Tuple[float, str, bytes]]" = OrderedDict()
+_stats_cache: Optional[Tuple[float, str, bytes]] = None
+
+
+def _clear_caches() -> None:
+    """Drop cached master wines and stats after a write"""
+    global _stats_cache
+    _wine_cache.clear()
+    _stats_cache = None
+
+
+def _cache_entry(body: bytes, ttl: float) -> Tuple[float, str, bytes]:
+    """(expires, etag, body) for a serialized response"""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return time.monotonic() + ttl, etag, body
+
+
+def _get_cached_wine(key: Tuple[str, str]) -> Optional[Tuple[float, str, bytes]]:
+    """Return an unexpired cached wine response, if any"""
+    entry = _wine_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    _wine_cache.move_to_end(key)
+    return entry
+
+
+def _cache_wine(key: Tuple[str, str], wine: Dict[str, Any]) -> Tuple[float, str, bytes]:
+    """Serialize a wine response once and keep it for later requests"""
+    entry = _cache_entry(orjson.dumps(wine), _WINE_CACHE_TTL)
+    _wine_cache[key] = entry
+    _wine_cache.move_to_end(key)
+    while len(_wine_cache) > _WINE_CACHE_MAXSIZE:
+        _wine_cache.popitem(last=False)
+    return entry
+
+
+def _etag_response(request: Request, entry: Tuple[float, str, bytes]) -> Response:
+    """Send a cached JSON body, or 304 when the client already has it"""
+    _, etag, body = entry
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+# $project stage mapping a Wine document to the AdminWineResponse shape
+_ADMIN_WINE_PROJECTION = {
+    "_id": 0,
+    "id": {"$toString": "$_id"},
+    "name": 1,
+    "producer": {"$ifNull": ["$producer", None]},
+    "vintage": {"$ifNull": ["$vintage", None]},
+    "wine_type": {"$ifNull": ["$wine_type", "red"]},
+    "region": {"$ifNull": ["$region", ""]},
+    "country": {"$ifNull": ["$country", ""]},
+    "appellation": {"$ifNull": ["$appellation", None]},
+    "alcohol_content": {"$ifNull": ["$alcohol_content", None]},
+    "grape_varieties": {"$ifNull": ["$grape_varieties", []]},
+    "tasting_notes": {"$ifNull": ["$tasting_notes", ""]},
+    "food_pairings": {"$ifNull": ["$food_pairings", []]},
+    "is_public": {"$ifNull": ["$is_public", False]},
+    "data_source": {"$ifNull": ["$data_source", "manual"]},
+    "barcode": {"$ifNull": ["$barcode", None]},
+    "created_at": 1,
+    "updated_at": 1
+}
+
+
+@router.get(
+    "/wines",
+    response_class=ORJSONResponse,
+    responses={200: {"model": List[AdminWineResponse]}}
+)
 async def list_master_wines(
-    skip: int = Query(0, ge=0),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use cursor instead; ignored with a cursor"),
     limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description="Keyset cursor: the X-Next-Cursor header of the previous page"
+    ),
     wine_type: Optional[str] = None,
     region: Optional[str] = None,
     country: Optional[str] = None,
     search: Optional[str] = None,
+    prefix: bool = Query(False, description="Match search as a name/producer prefix instead of words"),
     barcode: Optional[str] = None,
     current_user: User = Depends(require_admin)
 ):
     """
     List master wine database (admin only)
     These are the wine templates users can add to their cellier
+    
+    Ordered by _id, or by relevance for a word search. When a full page is
+    returned, the X-Next-Cursor response header holds the cursor for the
+    next one.
     """
     query = {"user_id": None}  # Master wines have no user_id
+    # The cursor already positions the page, so skip is not applied on top
+    if cursor:
+        skip = 0
     
     if wine_type:
         query["wine_type"] = wine_type
@@ -128,142 +346,188 @@ async def list_master_wines(
         query["country"] = country
     if barcode:
         query["barcode"] = barcode
-    if search:
+    # Single characters are not words to the text index, so they are always
+    # matched as a prefix
+    text_search = bool(search) and not prefix and len(search.strip()) > 1
+    if text_search:
+        # Word search through the wine_text_search index
+        query["$text"] = {"$search": _plain_text_search(search)}
+    elif search:
+        # Typeahead: anchored pattern instead of an unanchored substring scan
         query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"producer": {"$regex": search, "$options": "i"}}
+            {"name_lower": _safe_prefix(search)},
+            {"producer_lower": _safe_prefix(search)}
         ]
     
-    wines = await Wine.find(query).skip(skip).limit(limit).to_list()
+    # Project straight into the AdminWineResponse shape so no Wine document
+    # or response model is built per row
+    if text_search:
+        # Best matches first; the keyset cursor is "<score>_<id>" of the
+        # last row
+        pipeline = [
+            {"$match": query},
+            {"$addFields": {"_score": {"$meta": "textScore"}}}
+        ]
+        if cursor:
+            score, last_id = _decode_score_cursor(cursor)
+            pipeline.append({"$match": {"$or": [
+                {"_score": {"$lt": score}},
+                {"_score": score, "_id": {"$gt": last_id}}
+            ]}})
+        pipeline += [
+            {"$sort": {"_score": -1, "_id": 1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": {**_ADMIN_WINE_PROJECTION, "_score": 1}}
+        ]
+        wines = await Wine.aggregate(pipeline).to_list()
+        scores = [wine.pop("_score") for wine in wines]
+    else:
+        # Keyset pagination on _id, so later pages seek instead of skipping rows
+        if cursor:
+            if not ObjectId.is_valid(cursor):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            query["_id"] = {"$gt": ObjectId(cursor)}
+        # A barcode narrows the match to a handful of wines; pin its index so
+        # the planner doesn't pick an _id-ordered index and scan instead
+        options = {"hint": "wine_user_barcode"} if barcode else {}
+        wines = await Wine.aggregate([
+            {"$match": query},
+            {"$sort": {"_id": 1}},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": _ADMIN_WINE_PROJECTION}
+        ], **options).to_list()
     
-    return [
-        AdminWineResponse(
-            id=str(wine.id),
-            name=wine.name,
-            producer=wine.producer,
-            vintage=wine.vintage,
-            wine_type=wine.wine_type,
-            region=wine.region,
-            country=wine.country,
-            appellation=wine.appellation,
-            alcohol_content=wine.alcohol_content,
-            grape_varieties=wine.grape_varieties,
-            tasting_notes=wine.tasting_notes,
-            food_pairings=wine.food_pairings,
-            is_public=wine.is_public,
-            data_source=wine.data_source,
-            barcode=wine.barcode,
-            created_at=wine.created_at,
-            updated_at=wine.updated_at
-        )
-        for wine in wines
-    ]
+    headers = {}
+    if len(wines) == limit:
+        last_id = wines[-1]["id"]
+        headers["X-Next-Cursor"] = f"{scores[-1]!r}_{last_id}" if text_search else last_id
+    
+    return ORJSONResponse(headers=headers, content=wines)
 
 
-@router.get("/wines/{wine_id}", response_model=AdminWineResponse)
+@router.get(
+    "/wines/{wine_id}",
+    response_class=Response,
+    responses={200: {"model": AdminWineResponse}, 304: {"description": "Not modified"}}
+)
 async def get_master_wine(
     wine_id: str,
+    request: Request,
     current_user: User = Depends(require_admin)
 ):
     """Get specific master wine"""
-    wine = await Wine.get(wine_id)
-    if not wine or wine.user_id is not None:
-        raise HTTPException(status_code=404, detail="Master wine not found")
+    entry = _get_cached_wine(("id", wine_id))
+    if entry is not None:
+        return _etag_response(request, entry)
     
-    return AdminWineResponse(
-        id=str(wine.id),
-        name=wine.name,
-        producer=wine.producer,
-        vintage=wine.vintage,
-        wine_type=wine.wine_type,
-        region=wine.region,
-        country=wine.country,
-        appellation=wine.appellation,
-        alcohol_content=wine.alcohol_content,
-        grape_varieties=wine.grape_varieties,
-        tasting_notes=wine.tasting_notes,
-        food_pairings=wine.food_pairings,
-        is_public=wine.is_public,
-        data_source=wine.data_source,
-        barcode=wine.barcode,
-        created_at=wine.created_at,
-        updated_at=wine.updated_at
+    # Raw projected document: only the response fields, no Wine built
+    wine = await Wine.get_pymongo_collection().find_one(
+        _master_wine_filter(wine_id),
+        projection=_ADMIN_WINE_PROJECTION
     )
+    if not wine:
+        raise HTTPException(status_code=404, detail="Master wine not found")
+    
+    return _etag_response(request, _cache_wine(("id", wine_id), wine))
 
 
-@router.post("/wines", response_model=AdminWineResponse)
+@router.post(
+    "/wines",
+    response_class=ORJSONResponse,
+    responses={200: {"model": AdminWineResponse}}
+)
 async def create_master_wine(
     wine_data: AdminWineCreate,
     current_user: User = Depends(require_admin)
 ):
     """Create new master wine (admin only)"""
-    wine = Wine(
-        **wine_data.dict(),
-        user_id=None,  # Master wines have no user
-        current_quantity=0,  # Master wines don't have inventory
-        data_source="admin"
-    )
-    await wine.insert()
+    wine = _new_master_wine(wine_data)
+    try:
+        await Wine.get_pymongo_collection().insert_one(_insert_document(wine))
+    except DuplicateKeyError:
+        raise _duplicate_barcode_error()
+    _clear_caches()
     
-    return AdminWineResponse(
-        id=str(wine.id),
-        name=wine.name,
-        producer=wine.producer,
-        vintage=wine.vintage,
-        wine_type=wine.wine_type,
-        region=wine.region,
-        country=wine.country,
-        appellation=wine.appellation,
-        alcohol_content=wine.alcohol_content,
-        grape_varieties=wine.grape_varieties,
-        tasting_notes=wine.tasting_notes,
-        food_pairings=wine.food_pairings,
-        is_public=wine.is_public,
-        data_source=wine.data_source,
-        barcode=wine.barcode,
-        created_at=wine.created_at,
-        updated_at=wine.updated_at
-    )
+    return ORJSONResponse(content=_wine_to_response(wine))
 
 
-@router.put("/wines/{wine_id}", response_model=AdminWineResponse)
+@router.post(
+    "/wines/bulk",
+    response_class=ORJSONResponse,
+    responses={200: {"model": BulkCreateResponse}}
+)
+async def bulk_create_master_wines(
+    wines_data: List[AdminWineCreate],
+    current_user: User = Depends(require_admin)
+):
+    """
+    Create many master wines at once (admin only)
+    
+    All wines are sent in a single unordered insert_many, so one rejected
+    wine does not stop the others; rejected ones are listed in `errors` by
+    their position in the request.
+    """
+    wines = [_new_master_wine(wine_data) for wine_data in wines_data]
+    if not wines:
+        return ORJSONResponse(content={"inserted_ids": [], "errors": []})
+    
+    errors = []
+    try:
+        await Wine.get_pymongo_collection().insert_many(
+            [_insert_document(wine) for wine in wines],
+            ordered=False
+        )
+    except BulkWriteError as e:
+        errors = [
+            {"index": error["index"], "detail": error.get("errmsg", "")}
+            for error in e.details.get("writeErrors", [])
+        ]
+    _clear_caches()
+    
+    failed = {error["index"] for error in errors}
+    return ORJSONResponse(content={
+        "inserted_ids": [str(wine.id) for i, wine in enumerate(wines) if i not in failed],
+        "errors": errors
+    })
+
+
+@router.put(
+    "/wines/{wine_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": AdminWineResponse}}
+)
 async def update_master_wine(
     wine_id: str,
     wine_data: AdminWineUpdate,
     current_user: User = Depends(require_admin)
 ):
     """Update master wine (admin only)"""
-    wine = await Wine.get(wine_id)
-    if not wine or wine.user_id is not None:
+    # Set only the sent fields and read back the result in one atomic
+    # find_one_and_update; the master-wine check is part of the filter and
+    # only the response fields are returned
+    update_dict = wine_data.model_dump(exclude_unset=True)
+    update_dict["updated_at"] = _now()
+    search_fields = Wine.search_fields(update_dict.get("name"), update_dict.get("producer"))
+    if "name" in update_dict:
+        update_dict["name_lower"] = search_fields["name_lower"]
+    if "producer" in update_dict:
+        update_dict["producer_lower"] = search_fields["producer_lower"]
+    try:
+        wine = await Wine.get_pymongo_collection().find_one_and_update(
+            _master_wine_filter(wine_id),
+            {"$set": update_dict},
+            projection=_ADMIN_WINE_PROJECTION,
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise _duplicate_barcode_error()
+    if not wine:
         raise HTTPException(status_code=404, detail="Master wine not found")
+    _clear_caches()
     
-    # Update fields
-    update_dict = wine_data.dict(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(wine, field, value)
-    
-    wine.updated_at = datetime.utcnow()
-    await wine.save()
-    
-    return AdminWineResponse(
-        id=str(wine.id),
-        name=wine.name,
-        producer=wine.producer,
-        vintage=wine.vintage,
-        wine_type=wine.wine_type,
-        region=wine.region,
-        country=wine.country,
-        appellation=wine.appellation,
-        alcohol_content=wine.alcohol_content,
-        grape_varieties=wine.grape_varieties,
-        tasting_notes=wine.tasting_notes,
-        food_pairings=wine.food_pairings,
-        is_public=wine.is_public,
-        data_source=wine.data_source,
-        barcode=wine.barcode,
-        created_at=wine.created_at,
-        updated_at=wine.updated_at
-    )
+    return ORJSONResponse(content=wine)
 
 
 @router.delete("/wines/{wine_id}")
@@ -272,72 +536,114 @@ async def delete_master_wine(
     current_user: User = Depends(require_admin)
 ):
     """Delete master wine (admin only)"""
-    wine = await Wine.get(wine_id)
-    if not wine or wine.user_id is not None:
+    # Single delete_one; the master-wine check is part of the filter
+    result = await Wine.find_one(_master_wine_filter(wine_id)).delete()
+    if not result or not result.deleted_count:
         raise HTTPException(status_code=404, detail="Master wine not found")
+    _clear_caches()
     
-    await wine.delete()
     return {"message": "Master wine deleted successfully"}
 
 
-@router.get("/wines/barcode/{barcode}", response_model=AdminWineResponse)
+@router.get(
+    "/wines/barcode/{barcode}",
+    response_class=Response,
+    responses={200: {"model": AdminWineResponse}, 304: {"description": "Not modified"}}
+)
 async def find_wine_by_barcode(
     barcode: str,
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """
     Find wine by barcode (available to all authenticated users)
     Used for barcode scanning feature
     """
-    wine = await Wine.find_one({
-        "barcode": barcode,
-        "user_id": None  # Only search master wines
-    })
+    entry = _get_cached_wine(("barcode", barcode))
+    if entry is not None:
+        return _etag_response(request, entry)
+    
+    # Served by the unique master-wine barcode index; only the response
+    # fields come back over the wire
+    wine = await Wine.get_pymongo_collection().find_one(
+        {"barcode": barcode, "user_id": None},  # Only search master wines
+        projection=_ADMIN_WINE_PROJECTION
+    )
     
     if not wine:
         raise HTTPException(status_code=404, detail="Wine not found with this barcode")
     
-    return AdminWineResponse(
-        id=str(wine.id),
-        name=wine.name,
-        producer=wine.producer,
-        vintage=wine.vintage,
-        wine_type=wine.wine_type,
-        region=wine.region,
-        country=wine.country,
-        appellation=wine.appellation,
-        alcohol_content=wine.alcohol_content,
-        grape_varieties=wine.grape_varieties,
-        tasting_notes=wine.tasting_notes,
-        food_pairings=wine.food_pairings,
-        is_public=wine.is_public,
-        data_source=wine.data_source,
-        barcode=wine.barcode,
-        created_at=wine.created_at,
-        updated_at=wine.updated_at
-    )
+    return _etag_response(request, _cache_wine(("barcode", barcode), wine))
 
 
 @router.get("/stats/summary")
 async def get_master_wine_stats(
+    request: Request,
     current_user: User = Depends(require_admin)
 ):
     """Get master wine database statistics"""
-    total = await Wine.find({"user_id": None}).count()
+    global _stats_cache
+    
+    if _stats_cache is not None and _stats_cache[0] > time.monotonic():
+        return _etag_response(request, _stats_cache)
     
-    # Count with barcodes
-    with_barcode = await Wine.find({
-        "user_id": None,
-        "barcode": {"$exists": True, "$ne": ""}
-    }).count()
+    # One pass over the master wines for all three numbers
+    facets = (await Wine.aggregate([
+        {"$match": {"user_id": None}},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "by_type": [{"$group": {"_id": "$wine_type", "count": {"$sum": 1}}}],
+            "with_barcode": [
+                {"$match": {"barcode": {"$nin": [None, ""]}}},
+                {"$count": "n"}
+            ]
+        }}
+    ]).to_list())[0]
     
-    # TODO: Fix aggregation - Beanie's aggregate().to_list() has async issues
-    # For now, return basic stats without type breakdown
-    return {
-        "total": total,
-        "by_type": {},  # Temporarily disabled due to Beanie async issue
-        "with_barcode": with_barcode
+    stats = {
+        "total": facets["total"][0]["n"] if facets["total"] else 0,
+        "by_type": {item["_id"]: item["count"] for item in facets["by_type"]},
+        "with_barcode": facets["with_barcode"][0]["n"] if facets["with_barcode"] else 0
     }
+    _stats_cache = _cache_entry(orjson.dumps(stats), _STATS_CACHE_TTL)
+    return _etag_response(request, _stats_cache)
+
+
+_MAX_IMAGE_SIZE = 5 * 1024 * 1024
+_UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _looks_like_image(head: bytes) -> bool:
+    """Check the leading bytes for a JPEG, PNG, GIF, WebP or HEIF/AVIF image"""
+    if head.startswith((b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")):
+        return True
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return True
+    return head[4:8] == b"ftyp" and head[8:12] in (b"heic", b"heix", b"mif1", b"avif")
+
+
+_THUMBNAIL_SIZES = (256, 1024)
+
+
+def _remove_files(*paths: Path) -> None:
+    """Delete upload files left by a failed upload (missing ones are fine)"""
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+def _write_thumbnails(file_path: Path) -> None:
+    """Write the WebP variants of an uploaded wine image (background task)"""
+    try:
+        with Image.open(file_path) as image:
+            for size in _THUMBNAIL_SIZES:
+                variant = image.copy()
+                variant.thumbnail((size, size))
+                if variant.mode not in ("RGB", "RGBA"):
+                    variant = variant.convert("RGBA" if "A" in variant.getbands() else "RGB")
+                variant.save(file_path.with_name(f"{file_path.stem}_{size}.webp"), "WEBP")
+    except Exception:
+        # The original upload is already saved and linked; variants are optional
+        logger.exception("Could not create thumbnails for %s", file_path.name)
 
 
 class ImageUploadResponse(BaseModel):
@@ -346,19 +652,26 @@ class ImageUploadResponse(BaseModel):
     filename: str
 
 
-@router.post("/wines/{wine_id}/image", response_model=ImageUploadResponse)
+@router.post(
+    "/wines/{wine_id}/image",
+    response_class=ORJSONResponse,
+    responses={200: {"model": ImageUploadResponse}}
+)
 async def upload_wine_image(
     wine_id: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     current_user: User = Depends(require_admin)
 ):
     """
     Upload image for a wine bottle
+    
+    256px and 1024px WebP variants (<name>_256.webp, <name>_1024.webp) are
+    written next to the image in the background.
     """
-    # Check if wine exists
-    wine = await Wine.get(wine_id)
-    if not wine:
-        raise HTTPException(status_code=404, detail="Wine not found")
+    # Malformed ids are rejected before anything is read or written; whether
+    # the wine exists is known from the update below
+    oid = _object_id_or_404(wine_id, "Wine not found")
     
     # Validate file type
     if not file.content_type or not file.content_type.startswith('image/'):
@@ -367,34 +680,63 @@ async def upload_wine_image(
             detail="File must be an image"
         )
     
-    # Validate file size (5MB max)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
-        raise HTTPException(
-            status_code=413,
-            detail="Image must not exceed 5 MB"
-        )
-    
-    # Generate unique filename
-    file_extension = Path(file.filename or "image.jpg").suffix
-    unique_filename = f"wine_{wine_id}_{uuid.uuid4()}{file_extension}"
+    # Generate unique filename (415 for unsupported image types)
+    unique_filename = unique_image_filename(file.content_type, f"wine_{wine_id}_")
     
     # Create upload directory if it doesn't exist
     upload_dir = Path(settings.UPLOAD_DIR) / "wines"
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    await run_in_threadpool(upload_dir.mkdir, parents=True, exist_ok=True)
     
-    # Save file
+    # Save file in chunks, checking the real file type on the first chunk and
+    # stopping as soon as the size limit (5MB max) is exceeded. Disk writes
+    # run in the threadpool so they never block the event loop. The file
+    # gets its final name before the wine is pointed at it, and is removed
+    # again if the wine turns out not to exist.
     file_path = upload_dir / unique_filename
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    part_path = upload_dir / f".{unique_filename}.part"
+    total = 0
+    try:
+        out = await run_in_threadpool(open, part_path, "wb")
+        try:
+            while chunk := await file.read(_UPLOAD_CHUNK_SIZE):
+                if total == 0 and not _looks_like_image(chunk):
+                    raise HTTPException(
+                        status_code=400,
+                        detail="File must be an image"
+                    )
+                total += len(chunk)
+                if total > _MAX_IMAGE_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail="Image must not exceed 5 MB"
+                    )
+                await run_in_threadpool(out.write, chunk)
+        finally:
+            await run_in_threadpool(out.close)
+        if total == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="File must be an image"
+            )
+        await run_in_threadpool(part_path.replace, file_path)
+        
+        # Update wine with image URL ($set of the two fields only, no fetch)
+        image_url = f"/uploads/wines/{unique_filename}"
+        result = await Wine.get_pymongo_collection().update_one(
+            {"_id": oid},
+            {"$set": {"image_url": image_url, "updated_at": _now()}}
+        )
+        if result.matched_count == 0:
+            raise HTTPException(status_code=404, detail="Wine not found")
+    except BaseException:
+        await run_in_threadpool(_remove_files, part_path, file_path)
+        raise
+    _clear_caches()
     
-    # Update wine with image URL
-    image_url = f"/uploads/wines/{unique_filename}"
-    wine.image_url = image_url
-    wine.updated_at = datetime.utcnow()
-    await wine.save()
+    # Resized variants are made after the response is sent
+    background_tasks.add_task(_write_thumbnails, file_path)
     
-    return ImageUploadResponse(
-        url=image_url,
-        filename=unique_filename
-    )
+    return ORJSONResponse(content={
+        "url": image_url,
+        "filename": unique_filename
+    })
@@ -5,13 +5,13 @@ from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from sqlalchemy.orm import Session
 from typing import Optional
 import os
-from uuid import uuid4
 import time
 
 from app.core.database import get_db
 from app.core.config import settings
 from app.services.ai_recipe_extraction import ai_recipe_service, ExtractedRecipe
 from app.services.ocr_service import ocr_service
+from app.services.uploads import save_upload, unique_image_filename
 from app.models.mongodb import AIExtractionLog
 
 router = APIRouter()
@@ -45,23 +45,17 @@ async def extract_recipe_from_image(
     if not file.content_type or not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    contents = await file.read()
     max_size = getattr(settings, 'MAX_UPLOAD_SIZE', 10 * 1024 * 1024)
-    if len(contents) > max_size:
-        raise HTTPException(status_code=413, detail="File too large")
     
-    # Save file
+    # Save file (streamed; rejected as soon as it exceeds max_size)
     upload_dir = getattr(settings, 'UPLOAD_DIR', '/tmp/uploads')
-    os.makedirs(upload_dir, exist_ok=True)
-    file_id = str(uuid4())
-    filename = file.filename or 'upload.jpg'
-    file_path = os.path.join(upload_dir, f"{file_id}_{filename}")
+    filename = unique_image_filename(file.content_type)
+    file_path = os.path.join(upload_dir, filename)
     
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    image_size = await save_upload(file, file_path, max_size)
     
     # Generate image URL for frontend
-    image_url = f"/uploads/{file_id}_{filename}"
+    image_url = f"/uploads/{filename}"
     
     # Start timing for logging
     start_time = time.time()
@@ -75,7 +69,7 @@ async def extract_recipe_from_image(
         extraction_method=use_provider,  # Required field
         original_image_path=file_path,
         image_url=image_url,
-        image_size_bytes=len(contents),
+        image_size_bytes=image_size,
         success=False  # Will update on success
     )
     
@@ -212,7 +206,7 @@ async def extract_recipe_from_image(
                     model_name='tesseract',
                     original_image_path=file_path,
                     image_url=image_url,
-                    image_size_bytes=len(contents),
+                    image_size_bytes=image_size,
                     recipe_title=result.title,
                     confidence_score=result.confidence_score,
                     success=True,
@@ -231,7 +225,7 @@ async def extract_recipe_from_image(
                     provider='tesseract',
                     original_image_path=file_path,
                     image_url=image_url,
-                    image_size_bytes=len(contents),
+                    image_size_bytes=image_size,
                     success=False,
                     error_message=str(fallback_error),
                     processing_time_ms=fallback_time,
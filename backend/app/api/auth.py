@@ -2,6 +2,7 @@
 Authentication API routes
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from app.core.database import get_db
@@ -11,7 +12,8 @@ from app.core.security import (
     verify_password,
     get_password_hash,
     get_current_user,
-    verify_token
+    verify_token,
+    duplicate_user_detail
 )
 from app.models.user import User, UserRole
 from typing import Optional
@@ -77,23 +79,6 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
     """
     Register a new user with email and password
     """
-    # Check if user already exists
-    existing_user = db.query(User).filter(
-        (User.email == request.email) | (User.username == request.username)
-    ).first()
-    
-    if existing_user:
-        if existing_user.email == request.email:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered"
-            )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken"
-            )
-    
     # Create new user
     hashed_password = get_password_hash(request.password)
     user = User(
@@ -104,7 +89,18 @@ async def register(request: RegisterRequest, db: Session = Depends(get_db)):
         is_active=True
     )
     db.add(user)
-    db.commit()
+    # Let the unique indexes reject duplicates instead of checking first
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        detail = duplicate_user_detail(e)
+        if detail is None:
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
     db.refresh(user)
     
     # Create tokens
@@ -2,6 +2,7 @@
 API endpoints for ingredients using MongoDB.
 """
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
 from app.models.mongodb import Ingredient
 
@@ -25,33 +26,39 @@ async def search_ingredients(
     - **skip**: Number of records to skip for pagination (default: 0)
     - **custom_only**: If true, only return custom ingredients
     """
+    # Project straight into the response shape with localized names
+    projection = {
+        "_id": 0,
+        "id": {"$toString": "$_id"},
+        "off_id": 1,
+        "name": Ingredient.name_expr(language),
+        "names": {"$ifNull": ["$names", {}]},
+        "vegan": Ingredient.property_flag_expr("vegan"),
+        "vegetarian": Ingredient.property_flag_expr("vegetarian"),
+        "custom": {"$ifNull": ["$custom", False]},
+        "wikidata_id": {"$ifNull": ["$wikidata_id", None]}
+    }
+    
     if search:
         ingredients = await Ingredient.search(
             query=search,
             language=language,
             limit=limit,
             skip=skip,
-            custom_only=custom_only
+            custom_only=custom_only,
+            projection=projection
         )
     else:
         # No search query - get all ingredients with limit and skip
         query_filter = {"custom": True} if custom_only else {}
-        ingredients = await Ingredient.find(query_filter).skip(skip).limit(limit).to_list()
-    
-    # Format response with localized names
-    return [
-        {
-            "id": str(ing.id),
-            "off_id": ing.off_id,
-            "name": ing.get_name(language),
-            "names": ing.names,
-            "vegan": ing.is_vegan(),
-            "vegetarian": ing.is_vegetarian(),
-            "custom": ing.custom,
-            "wikidata_id": ing.wikidata_id,
-        }
-        for ing in ingredients
-    ]
+        ingredients = await Ingredient.aggregate([
+            {"$match": query_filter},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": projection}
+        ]).to_list()
+    
+    return ORJSONResponse(content=ingredients)
 
 
 @router.get("/{off_id}", summary="Get ingredient by ID")
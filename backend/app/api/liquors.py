@@ -1,15 +1,30 @@
 """
 Liquors API routes
 """
+import re
+import time
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
+from beanie import UpdateResponse
+from bson import ObjectId
 from datetime import datetime
 from app.models.mongodb import Liquor
 from app.models.mongodb.liquor import ProfessionalRating
 
 router = APIRouter()
 
+# Liquor stats, dropped by the writes below; the TTL bounds staleness from
+# anything else
+_STATS_CACHE_TTL = 60.0  # seconds
+_stats_cache: Optional[Tuple[float, dict]] = None
+
+
+def _clear_stats() -> None:
+    """Drop cached liquor stats after a write"""
+    global _stats_cache
+    _stats_cache = None
+
 
 class LiquorResponse(BaseModel):
     """Liquor response model"""
@@ -114,9 +129,11 @@ async def list_liquors(
     if country:
         query["country"] = country
     if search:
+        # Escaped: search is a plain substring, never a user-supplied regex
+        pattern = re.escape(search)
         query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"brand": {"$regex": search, "$options": "i"}}
+            {"name": {"$regex": pattern, "$options": "i"}},
+            {"brand": {"$regex": pattern, "$options": "i"}}
         ]
     if in_stock:
         query["current_quantity"] = {"$gt": 0}
@@ -168,8 +185,9 @@ async def get_liquor(liquor_id: str):
 @router.post("/", response_model=LiquorResponse)
 async def create_liquor(liquor_data: LiquorCreate):
     """Create new liquor"""
-    liquor = Liquor(**liquor_data.dict())
+    liquor = Liquor(**liquor_data.model_dump())
     await liquor.insert()
+    _clear_stats()
     
     return LiquorResponse(
         id=str(liquor.id),
@@ -190,17 +208,20 @@ async def create_liquor(liquor_data: LiquorCreate):
 @router.put("/{liquor_id}", response_model=LiquorResponse)
 async def update_liquor(liquor_id: str, liquor_data: LiquorUpdate):
     """Update liquor"""
-    liquor = await Liquor.get(liquor_id)
-    if not liquor:
+    if not ObjectId.is_valid(liquor_id):
         raise HTTPException(status_code=404, detail="Liquor not found")
     
-    # Update fields
-    update_dict = liquor_data.dict(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(liquor, field, value)
-    
-    liquor.updated_at = datetime.utcnow()
-    await liquor.save()
+    # $set only the sent fields and read back the result in one atomic
+    # find_one_and_update
+    update_dict = liquor_data.model_dump(exclude_unset=True)
+    update_dict["updated_at"] = datetime.utcnow()
+    liquor = await Liquor.find_one({"_id": ObjectId(liquor_id)}).update(
+        {"$set": update_dict},
+        response_type=UpdateResponse.NEW_DOCUMENT
+    )
+    if not liquor:
+        raise HTTPException(status_code=404, detail="Liquor not found")
+    _clear_stats()
     
     return LiquorResponse(
         id=str(liquor.id),
@@ -226,27 +247,31 @@ async def delete_liquor(liquor_id: str):
         raise HTTPException(status_code=404, detail="Liquor not found")
     
     await liquor.delete()
+    _clear_stats()
     return {"message": "Liquor deleted successfully"}
 
 
 @router.get("/stats/summary")
 async def get_liquor_stats():
     """Get liquor statistics"""
-    total = await Liquor.count()
+    global _stats_cache
     
-    # Aggregate by type
-    pipeline = [
-        {"$group": {"_id": "$spirit_type", "count": {"$sum": 1}}}
-    ]
-    by_type_cursor = Liquor.aggregate(pipeline)
-    by_type_list = await by_type_cursor.to_list()
-    by_type = {item["_id"]: item["count"] for item in by_type_list}
+    if _stats_cache is not None and _stats_cache[0] > time.monotonic():
+        return _stats_cache[1]
     
-    # Count in stock
-    in_stock = await Liquor.find({"current_quantity": {"$gt": 0}}).count()
+    # One pass over the collection for all three numbers
+    facets = (await Liquor.aggregate([
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "in_stock": [{"$match": {"current_quantity": {"$gt": 0}}}, {"$count": "n"}],
+            "by_type": [{"$group": {"_id": "$spirit_type", "count": {"$sum": 1}}}]
+        }}
+    ]).to_list())[0]
     
-    return {
-        "total": total,
-        "in_stock": in_stock,
-        "by_type": by_type
+    stats = {
+        "total": facets["total"][0]["n"] if facets["total"] else 0,
+        "in_stock": facets["in_stock"][0]["n"] if facets["in_stock"] else 0,
+        "by_type": {item["_id"]: item["count"] for item in facets["by_type"]}
     }
+    _stats_cache = (time.monotonic() + _STATS_CACHE_TTL, stats)
+    return stats
@@ -11,6 +11,7 @@ from app.core.database import get_db
 from app.core.config import settings
 from app.models.ocr_job import OCRJob
 from app.services.ocr_service import ocr_service
+from app.services.uploads import save_upload, unique_image_filename
 
 router = APIRouter()
 
@@ -35,17 +36,10 @@ async def upload_recipe_image(
     Upload recipe image for OCR processing
     Requires authentication in production
     """
-    # Validate file size
-    contents = await file.read()
-    if len(contents) > settings.MAX_UPLOAD_SIZE:
-        raise HTTPException(status_code=413, detail="File too large")
-    
-    # Save file
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
-    file_path = os.path.join(settings.UPLOAD_DIR, file.filename or f"upload_{OCRJob.__tablename__}.jpg")
-    
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Save file under a random name (415 for unsupported image types);
+    # streamed, rejected as soon as it exceeds MAX_UPLOAD_SIZE
+    file_path = os.path.join(settings.UPLOAD_DIR, unique_image_filename(file.content_type))
+    await save_upload(file, file_path, settings.MAX_UPLOAD_SIZE)
     
     # Generate accessible URL (relative path from uploads directory)
     image_filename = os.path.basename(file_path)
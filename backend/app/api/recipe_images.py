@@ -3,9 +3,9 @@ Recipe image upload endpoint
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from pydantic import BaseModel
-import uuid
 from pathlib import Path
 from app.core.config import settings
+from app.services.uploads import save_upload, unique_image_filename
 
 router = APIRouter()
 
@@ -29,26 +29,12 @@ async def upload_recipe_image(file: UploadFile = File(...)):
             detail="Le fichier doit être une image"
         )
     
-    # Validate file size (5MB max)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
-        raise HTTPException(
-            status_code=413,
-            detail="L'image ne doit pas dépasser 5 MB"
-        )
-    
-    # Generate unique filename
-    file_extension = Path(file.filename or "image.jpg").suffix
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    
-    # Create upload directory if it doesn't exist
-    upload_dir = Path(settings.UPLOAD_DIR) / "recipes"
-    upload_dir.mkdir(parents=True, exist_ok=True)
+    # Generate unique filename (415 for unsupported image types)
+    unique_filename = unique_image_filename(file.content_type)
     
-    # Save file
-    file_path = upload_dir / unique_filename
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Save file (streamed; 5MB max, upload directory created if needed)
+    file_path = Path(settings.UPLOAD_DIR) / "recipes" / unique_filename
+    await save_upload(file, file_path, 5 * 1024 * 1024, "L'image ne doit pas dépasser 5 MB")
     
     # Return URL (relative path)
     image_url = f"/uploads/recipes/{unique_filename}"
@@ -2,6 +2,7 @@
 Recipes API routes
 """
 import logging
+import re
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional
@@ -93,9 +94,11 @@ async def list_recipes(
     if cuisine:
         query["cuisine"] = cuisine
     if search:
+        # Escaped: search is a plain substring, never a user-supplied regex
+        pattern = re.escape(search)
         query["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
+            {"title": {"$regex": pattern, "$options": "i"}},
+            {"description": {"$regex": pattern, "$options": "i"}}
         ]
     
     # Query MongoDB directly
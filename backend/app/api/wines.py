@@ -1,19 +1,35 @@
 """
 Wines API routes (User's personal cellier)
 """
+import re
+import time
+from collections import OrderedDict
 from fastapi import APIRouter, HTTPException, Query, Depends, UploadFile, File
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
+from beanie import UpdateResponse
+from bson import ObjectId
 from datetime import datetime
 from pathlib import Path
-import uuid
 from app.models.mongodb import Wine
 from app.models.mongodb.wine import GrapeVariety, ProfessionalRating
 from app.core.security import get_current_user, optional_current_user
+from app.services.uploads import save_upload, unique_image_filename
 from app.models.user import User
 
 router = APIRouter()
 
+# Per-user cellier stats. The user's own writes below drop their entry; the
+# TTL bounds staleness from anything else
+_STATS_CACHE_TTL = 60.0  # seconds
+_STATS_CACHE_MAXSIZE = 1024
+_stats_cache: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+
+
+def _forget_stats(user_id: str) -> None:
+    """Drop a user's cached cellier stats after a write"""
+    _stats_cache.pop(user_id, None)
+
 
 class WineResponse(BaseModel):
     """Wine response model"""
@@ -133,9 +149,11 @@ async def list_wines(
     if country:
         query["country"] = country
     if search:
+        # Escaped: search is a plain substring, never a user-supplied regex
+        pattern = re.escape(search)
         query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"producer": {"$regex": search, "$options": "i"}}
+            {"name": {"$regex": pattern, "$options": "i"}},
+            {"producer": {"$regex": pattern, "$options": "i"}}
         ]
     if in_stock:
         query["current_quantity"] = {"$gt": 0}
@@ -185,9 +203,11 @@ async def list_master_wines(
     if country:
         query["country"] = country
     if search:
+        # Escaped: search is a plain substring, never a user-supplied regex
+        pattern = re.escape(search)
         query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"producer": {"$regex": search, "$options": "i"}}
+            {"name": {"$regex": pattern, "$options": "i"}},
+            {"producer": {"$regex": pattern, "$options": "i"}}
         ]
     
     wines = await Wine.find(query).skip(skip).limit(limit).to_list()
@@ -246,12 +266,13 @@ async def create_wine(
 ):
     """Create new wine in user's cellier"""
     # Convert to dict and override is_public for user wines
-    wine_dict = wine_data.dict()
+    wine_dict = wine_data.model_dump()
     wine_dict['is_public'] = False  # User wines are always private
     wine_dict['user_id'] = str(current_user.id)  # Associate with user
     
     wine = Wine(**wine_dict)
     await wine.insert()
+    _forget_stats(str(current_user.id))
     
     return WineResponse(
         id=str(wine.id),
@@ -277,17 +298,26 @@ async def update_wine(
     current_user: User = Depends(get_current_user)
 ):
     """Update wine in user's cellier"""
-    wine = await Wine.get(wine_id)
-    if not wine or wine.user_id != str(current_user.id):
+    if not ObjectId.is_valid(wine_id):
         raise HTTPException(status_code=404, detail="Wine not found")
     
-    # Update fields
-    update_dict = wine_data.dict(exclude_unset=True)
-    for field, value in update_dict.items():
-        setattr(wine, field, value)
-    
-    wine.updated_at = datetime.utcnow()
-    await wine.save()
+    # $set only the sent fields and read back the result in one atomic
+    # find_one_and_update; ownership is part of the filter. Update queries
+    # skip the save hooks, so keep the search fields in sync here
+    update_dict = wine_data.model_dump(exclude_unset=True)
+    search_fields = Wine.search_fields(update_dict.get("name"), update_dict.get("producer"))
+    if "name" in update_dict:
+        update_dict["name_lower"] = search_fields["name_lower"]
+    if "producer" in update_dict:
+        update_dict["producer_lower"] = search_fields["producer_lower"]
+    update_dict["updated_at"] = datetime.utcnow()
+    wine = await Wine.find_one({"_id": ObjectId(wine_id), "user_id": str(current_user.id)}).update(
+        {"$set": update_dict},
+        response_type=UpdateResponse.NEW_DOCUMENT
+    )
+    if not wine:
+        raise HTTPException(status_code=404, detail="Wine not found")
+    _forget_stats(str(current_user.id))
     
     return WineResponse(
         id=str(wine.id),
@@ -317,6 +347,7 @@ async def delete_wine(
         raise HTTPException(status_code=404, detail="Wine not found")
     
     await wine.delete()
+    _forget_stats(str(current_user.id))
     return {"message": "Wine deleted successfully"}
 
 
@@ -336,13 +367,14 @@ async def add_master_wine_to_cellier(
         raise HTTPException(status_code=404, detail="Master wine not found")
     
     # Create a copy for user's cellier
-    user_wine_data = master_wine.dict(exclude={"id", "user_id", "created_at", "updated_at"})
+    user_wine_data = master_wine.model_dump(exclude={"id", "user_id", "created_at", "updated_at"})
     user_wine_data["user_id"] = str(current_user.id)
     user_wine_data["current_quantity"] = quantity
     user_wine_data["is_public"] = False  # User wines are private
     
     user_wine = Wine(**user_wine_data)
     await user_wine.insert()
+    _forget_stats(str(current_user.id))
     
     return WineResponse(
         id=str(user_wine.id),
@@ -369,39 +401,38 @@ async def get_wine_stats(
     if not current_user:
         return {"total": 0, "in_stock": 0, "by_type": {}, "by_country": {}}
     
-    query = {"user_id": str(current_user.id)}
-    total = await Wine.find(query).count()
-    
-    # Aggregate by type
-    pipeline = [
-        {"$match": query},
-        {"$group": {"_id": "$wine_type", "count": {"$sum": 1}}}
-    ]
-    by_type_cursor = Wine.aggregate(pipeline)
-    by_type_list = await by_type_cursor.to_list()
-    by_type = {item["_id"]: item["count"] for item in by_type_list}
-    
-    # Aggregate by country
-    pipeline = [
-        {"$match": query},
-        {"$group": {"_id": "$country", "count": {"$sum": 1}}},
-        {"$sort": {"count": -1}},
-        {"$limit": 10}
-    ]
-    by_country_cursor = Wine.aggregate(pipeline)
-    by_country_list = await by_country_cursor.to_list()
-    by_country = {item["_id"]: item["count"] for item in by_country_list if item["_id"]}
-    
-    # Count in stock
-    in_stock_query = {**query, "current_quantity": {"$gt": 0}}
-    in_stock = await Wine.find(in_stock_query).count()
-    
-    return {
-        "total": total,
-        "in_stock": in_stock,
-        "by_type": by_type,
-        "by_country": by_country
+    user_id = str(current_user.id)
+    entry = _stats_cache.get(user_id)
+    if entry is not None and entry[0] > time.monotonic():
+        _stats_cache.move_to_end(user_id)
+        return entry[1]
+    
+    # One pass over the user's wines for all four numbers
+    facets = (await Wine.aggregate([
+        {"$match": {"user_id": user_id}},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "in_stock": [{"$match": {"current_quantity": {"$gt": 0}}}, {"$count": "n"}],
+            "by_type": [{"$group": {"_id": "$wine_type", "count": {"$sum": 1}}}],
+            "by_country": [
+                {"$group": {"_id": "$country", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$limit": 10}
+            ]
+        }}
+    ]).to_list())[0]
+    
+    stats = {
+        "total": facets["total"][0]["n"] if facets["total"] else 0,
+        "in_stock": facets["in_stock"][0]["n"] if facets["in_stock"] else 0,
+        "by_type": {item["_id"]: item["count"] for item in facets["by_type"]},
+        "by_country": {item["_id"]: item["count"] for item in facets["by_country"] if item["_id"]}
     }
+    _stats_cache[user_id] = (time.monotonic() + _STATS_CACHE_TTL, stats)
+    _stats_cache.move_to_end(user_id)
+    while len(_stats_cache) > _STATS_CACHE_MAXSIZE:
+        _stats_cache.popitem(last=False)
+    return stats
 
 
 class AddToCellierRequest(BaseModel):
@@ -463,6 +494,7 @@ async def add_wine_from_master(
     )
     
     await user_wine.insert()
+    _forget_stats(str(current_user.id))
     
     return WineResponse(
         id=str(user_wine.id),
@@ -531,28 +563,20 @@ async def upload_wine_image(
     if not file.content_type or not file.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
     
-    # Check file size (5MB limit)
-    contents = await file.read()
-    if len(contents) > 5 * 1024 * 1024:
-        raise HTTPException(status_code=413, detail="File too large (max 5MB)")
-    
     # Verify wine belongs to user
     wine = await Wine.get(wine_id)
     if not wine or wine.user_id != str(current_user.id):
         raise HTTPException(status_code=404, detail="Wine not found")
     
-    # Create uploads directory
+    # Uploads directory (created by save_upload if needed)
     upload_dir = Path("/uploads/wines")
-    upload_dir.mkdir(parents=True, exist_ok=True)
     
-    # Generate unique filename
-    file_ext = Path(file.filename).suffix if file.filename else '.jpg'
-    unique_filename = f"{uuid.uuid4()}{file_ext}"
+    # Generate unique filename (415 for unsupported image types)
+    unique_filename = unique_image_filename(file.content_type)
     file_path = upload_dir / unique_filename
     
-    # Save file
-    with open(file_path, "wb") as f:
-        f.write(contents)
+    # Save file (streamed; 5MB limit checked while copying)
+    await save_upload(file, file_path, 5 * 1024 * 1024, "File too large (max 5MB)")
     
     # Update wine with image URL
     wine.image_url = f"/uploads/wines/{unique_filename}"
@@ -4,7 +4,7 @@ Database connection and session management
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from beanie import init_beanie
 from app.core.config import settings
 
@@ -29,7 +29,7 @@ def get_db():
         db.close()
 
 # MongoDB connection
-mongodb_client: AsyncIOMotorClient = None
+mongodb_client: AsyncMongoClient = None
 
 def get_mongodb():
     """Get MongoDB client"""
@@ -49,8 +49,9 @@ async def init_mongodb():
     mongodb_url = getattr(settings, 'MONGODB_URL', 'mongodb://localhost:27017')
     mongodb_db_name = getattr(settings, 'MONGODB_DB_NAME', 'legrimoire')
     
-    # Create MongoDB client
-    mongodb_client = AsyncIOMotorClient(mongodb_url)
+    # Create MongoDB client (PyMongo's native asyncio driver, which Beanie
+    # 2.x is built on; no thread pool hop per operation like Motor)
+    mongodb_client = AsyncMongoClient(mongodb_url)
     
     print(f"✅ MongoDB client created: {mongodb_client is not None}")
     print(f"✅ MongoDB initialized: {mongodb_db_name}")
@@ -68,5 +69,5 @@ async def close_mongodb():
     """
     global mongodb_client
     if mongodb_client:
-        mongodb_client.close()
+        await mongodb_client.close()
         print("✅ MongoDB connection closed")
@@ -90,15 +90,20 @@ def calculate_cost(
     return input_cost + output_cost
 
 
+# OPENAI_MODELS is constant, so its filtered views are built once at import
+VISION_MODELS = {k: v for k, v in OPENAI_MODELS.items() if v["vision"]}
+RECOMMENDED_MODELS = {k: v for k, v in OPENAI_MODELS.items() if v["recommended"]}
+
+
 def get_available_models(
     vision_required: bool = True
 ) -> Dict[str, Dict[str, Any]]:
     """Get available models, optionally filtered by vision support"""
     if vision_required:
-        return {k: v for k, v in OPENAI_MODELS.items() if v["vision"]}
+        return VISION_MODELS
     return OPENAI_MODELS
 
 
 def get_recommended_models() -> Dict[str, Dict[str, Any]]:
     """Get recommended models for recipe extraction"""
-    return {k: v for k, v in OPENAI_MODELS.items() if v["recommended"]}
+    return RECOMMENDED_MODELS
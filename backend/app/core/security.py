@@ -1,12 +1,16 @@
 """
 Security and authentication utilities
 """
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+import hashlib
+import time
 import bcrypt
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from app.core.config import settings
 from app.core.database import get_db
@@ -15,6 +19,11 @@ from app.models.user import User, UserRole
 # HTTP Bearer for token extraction
 security = HTTPBearer()
 
+# Process-local token -> verified subject cache (see _user_from_token)
+_CLAIMS_CACHE_TTL = 300.0  # seconds
+_CLAIMS_CACHE_MAXSIZE = 1024
+_claims_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash using bcrypt"""
@@ -37,6 +46,23 @@ def get_password_hash(password: str) -> str:
     return hashed.decode('utf-8')
 
 
+def duplicate_user_detail(error: IntegrityError) -> Optional[str]:
+    """
+    Map a unique violation on users.email/users.username to an API message.
+    
+    The unique index is users_email_key on databases created from init.sql and
+    ix_users_email/ix_users_username otherwise, so match on the column name.
+    Returns None for any other integrity error.
+    """
+    diag = getattr(error.orig, "diag", None)
+    constraint = getattr(diag, "constraint_name", None) or ""
+    if "email" in constraint:
+        return "Email already registered"
+    if "username" in constraint:
+        return "Username already taken"
+    return None
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -68,6 +94,41 @@ def verify_token(token: str) -> Optional[dict]:
         return None
 
 
+def _user_from_token(token: str, db: Session) -> Optional[User]:
+    """
+    Resolve a bearer token to its User, or None if the token is invalid
+    
+    The verified subject of each token is cached (until the token expires,
+    at most _CLAIMS_CACHE_TTL seconds), so repeated requests with the same
+    token skip the JWT signature check. The user row is always loaded, so
+    role changes, deactivation and deletion apply immediately in every
+    worker.
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    
+    entry = _claims_cache.get(key)
+    if entry is not None and entry[0] > now:
+        _claims_cache.move_to_end(key)
+        user_id = entry[1]
+    else:
+        try:
+            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        except JWTError:
+            return None
+        user_id = payload.get("sub")
+        if user_id is None:
+            return None
+        # A token's claims never change, so they only need to expire with it
+        ttl = min(payload.get("exp", 0) - time.time(), _CLAIMS_CACHE_TTL)
+        if ttl > 0:
+            _claims_cache[key] = (now + ttl, user_id)
+            while len(_claims_cache) > _CLAIMS_CACHE_MAXSIZE:
+                _claims_cache.popitem(last=False)
+    
+    return db.query(User).filter(User.id == user_id).first()
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -79,16 +140,7 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _user_from_token(credentials.credentials, db)
     if user is None:
         raise credentials_exception
     
@@ -109,16 +161,7 @@ async def optional_current_user(
     if credentials is None:
         return None
     
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-    except JWTError:
-        return None
-    
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _user_from_token(credentials.credentials, db)
     if user is None or not user.is_active:
         return None
     
@@ -1,8 +1,11 @@
 """
 Le Grimoire - Main FastAPI Application
 """
+import logging
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from contextlib import asynccontextmanager
@@ -14,6 +17,9 @@ from app.api import (
 )
 from app.core.config import settings
 from app.core.database import init_mongodb, close_mongodb
+from app.services.valid_ingredients import sync_valid_ingredients
+
+logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -23,6 +29,13 @@ async def lifespan(app: FastAPI):
     """
     # Startup: Initialize MongoDB
     await init_mongodb()
+    # Mirror ingredient off_ids into Postgres for the recipe_ingredients FK.
+    # Ingredient imports and scripts/sync_valid_ingredients.py also sync, so a
+    # failure here only delays off_ids added since the last sync
+    try:
+        await sync_valid_ingredients()
+    except Exception:
+        logger.exception("valid_ingredients sync failed; recipes using ingredients missing from it will be rejected")
     yield
     # Shutdown: Close MongoDB connection
     await close_mongodb()
@@ -32,7 +45,8 @@ app = FastAPI(
     description="API pour la gestion de recettes avec OCR et intégration des spéciaux d'épiceries",
     version="1.0.0",
     lifespan=lifespan,
-    redirect_slashes=False  # Disable automatic trailing slash redirects
+    redirect_slashes=False,  # Disable automatic trailing slash redirects
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -57,8 +71,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor on admin lists
 )
 
+# Compress large JSON payloads (admin stats/logs, ingredient lists);
+# bodies under 1 KB are sent as-is
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 app.include_router(recipes.router, prefix="/api/v2/recipes", tags=["Recipes"])
@@ -8,7 +8,8 @@ from app.models.ingredient import (
     Ingredient,
     IngredientCategory,
     Unit,
-    RecipeIngredient
+    RecipeIngredient,
+    ValidIngredient
 )
 
 __all__ = [
@@ -24,5 +25,6 @@ __all__ = [
     "Ingredient",
     "IngredientCategory",
     "Unit",
-    "RecipeIngredient"
+    "RecipeIngredient",
+    "ValidIngredient"
 ]
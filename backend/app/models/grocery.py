@@ -1,7 +1,7 @@
 """
 Grocery store models
 """
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Numeric, Date
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Numeric, Date, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -33,4 +33,4 @@ class GrocerySpecial(Base):
     valid_until = Column(Date, nullable=False)
     scraped_at = Column(DateTime(timezone=True), server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
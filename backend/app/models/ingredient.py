@@ -1,7 +1,7 @@
 """
 Ingredient models
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, Numeric, ARRAY
+from sqlalchemy import Column, String, Text, Integer, BigInteger, Boolean, DateTime, ForeignKey, Numeric, ARRAY, Index, Identity, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -12,11 +12,11 @@ import uuid
 class IngredientCategory(Base):
     __tablename__ = "ingredient_categories"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, Identity(), primary_key=True)
     name = Column(String(100), nullable=False, unique=True)  # English name for backward compatibility
     name_en = Column(String(100), nullable=True)  # English name
     name_fr = Column(String(100), nullable=True)  # French name
-    parent_category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"), nullable=True)
+    parent_category_id = Column(BigInteger, ForeignKey("ingredient_categories.id"), nullable=True)
     display_order = Column(Integer, nullable=True)
     icon = Column(String(50), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -29,7 +29,7 @@ class IngredientCategory(Base):
 class Unit(Base):
     __tablename__ = "units"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, Identity(), primary_key=True)
     name = Column(String(50), nullable=False, unique=True)
     abbreviation = Column(String(20), nullable=True)
     type = Column(String(50), nullable=True)  # 'volume', 'weight', 'unit', 'temperature'
@@ -41,21 +41,30 @@ class Unit(Base):
 
 class Ingredient(Base):
     __tablename__ = "ingredients"
+    __table_args__ = (
+        Index(
+            "idx_ingredients_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index("idx_ingredients_aliases_gin", "aliases", postgresql_using="gin"),
+    )
     
-    id = Column(Integer, primary_key=True)  # Using integer ID from CSV
+    id = Column(Integer, Identity(always=False), primary_key=True)  # Integer ID from CSV, or generated
     name = Column(String(255), nullable=False)  # For backward compatibility
     english_name = Column(String(255), nullable=False)
     french_name = Column(String(255), nullable=False)
     gender = Column(String(1), nullable=True)  # 'm' or 'f' for French
     name_plural = Column(String(255), nullable=True)
-    category_id = Column(UUID(as_uuid=True), ForeignKey("ingredient_categories.id"), nullable=True)
+    category_id = Column(BigInteger, ForeignKey("ingredient_categories.id"), nullable=True)
     subcategory = Column(String(100), nullable=True)
     default_unit = Column(String(50), nullable=True)
     aliases = Column(ARRAY(Text), nullable=True)
     notes = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True, server_default='true')
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
     
     # Relationships
     category = relationship("IngredientCategory", back_populates="ingredients")
@@ -63,13 +72,39 @@ class Ingredient(Base):
     # images = relationship("IngredientImage", back_populates="ingredient", cascade="all, delete-orphan")  # Deprecated - using MongoDB
 
 
+class ValidIngredient(Base):
+    """
+    Postgres mirror of the MongoDB ingredient off_ids.
+    
+    recipe_ingredients.ingredient_off_id references this table so the
+    database rejects unknown ingredients. Kept in sync from MongoDB by
+    app.services.valid_ingredients.
+    """
+    __tablename__ = "valid_ingredients"
+    
+    off_id = Column(String(255), primary_key=True)
+
+
 class RecipeIngredient(Base):
     __tablename__ = "recipe_ingredients"
+    __table_args__ = (
+        Index("ix_recipe_ingredients_off_id", "ingredient_off_id"),
+        Index(
+            "idx_recipe_ingredients_recipe_order",
+            "recipe_id",
+            "display_order",
+            postgresql_include=["ingredient_id", "quantity", "unit"],
+        ),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     recipe_id = Column(UUID(as_uuid=True), ForeignKey("recipes.id", ondelete="CASCADE"), nullable=False)
     # Changed from integer to string to reference MongoDB OpenFoodFacts off_id
-    ingredient_off_id = Column(String(255), nullable=False)  # References MongoDB Ingredient.off_id
+    ingredient_off_id = Column(
+        String(255),
+        ForeignKey("valid_ingredients.off_id", name="fk_recipe_ingredients_off_id"),
+        nullable=True
+    )  # References MongoDB Ingredient.off_id (mirrored in valid_ingredients)
     # Keep old column for backward compatibility during migration
     ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="RESTRICT"), nullable=True)
     quantity = Column(Numeric(10, 3), nullable=True)
@@ -1,12 +1,10 @@
 """
 Ingredient Image models
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Integer, BigInteger, Boolean, DateTime, ForeignKey, Index, Identity, text, FetchedValue
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.core.database import Base
-from sqlalchemy.dialects.postgresql import UUID
-import uuid
 
 
 class IngredientImage(Base):
@@ -15,8 +13,17 @@ class IngredientImage(Base):
     Images can be sourced from various providers (Unsplash, Pexels, etc.)
     """
     __tablename__ = "ingredient_images"
+    __table_args__ = (
+        # At most one primary image per ingredient
+        Index(
+            "ix_ingredient_images_is_primary",
+            "ingredient_id",
+            unique=True,
+            postgresql_where=text("is_primary = true"),
+        ),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(BigInteger, Identity(), primary_key=True)
     ingredient_id = Column(Integer, ForeignKey("ingredients.id", ondelete="CASCADE"), nullable=False)
     
     # Image source and metadata
@@ -43,7 +50,7 @@ class IngredientImage(Base):
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
     
     # Relationship
     ingredient = relationship("Ingredient", back_populates="images")
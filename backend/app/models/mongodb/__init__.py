@@ -3,11 +3,11 @@ MongoDB models using Beanie ODM.
 These models interface with the OpenFoodFacts data in MongoDB.
 """
 
-from .ingredient import Ingredient
+from .ingredient import Ingredient, IngredientNames
 from .category import Category
 from .recipe import Recipe
 from .ai_extraction_log import AIExtractionLog
 from .wine import Wine
 from .liquor import Liquor
 
-__all__ = ["Ingredient", "Category", "Recipe", "AIExtractionLog", "Wine", "Liquor"]
+__all__ = ["Ingredient", "IngredientNames", "Category", "Recipe", "AIExtractionLog", "Wine", "Liquor"]
@@ -2,6 +2,7 @@
 AI Extraction Log MongoDB model for tracking AI usage.
 """
 from beanie import Document
+from pymongo import ASCENDING, DESCENDING
 from pydantic import Field, ConfigDict
 from typing import Optional, Dict, Any
 from datetime import datetime
@@ -56,12 +57,13 @@ class AIExtractionLog(Document):
         use_state_management = False
         use_revision = False
         indexes = [
-            "extraction_method",
-            "provider",
             "user_id",
             "recipe_id",
-            "created_at",
-            "success"
+            [("created_at", DESCENDING)],
+            # Equality filter + created_at range/sort used by /stats and /logs
+            [("provider", ASCENDING), ("created_at", DESCENDING)],
+            [("success", ASCENDING), ("created_at", DESCENDING)],
+            [("extraction_method", ASCENDING), ("created_at", DESCENDING)]
         ]
     
     def __repr__(self) -> str:
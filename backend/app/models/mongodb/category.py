@@ -4,7 +4,7 @@ Based on OpenFoodFacts categories taxonomy.
 """
 
 from datetime import datetime, UTC
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 from beanie import Document
 from pydantic import Field, field_validator
 
@@ -94,6 +94,14 @@ class Category(Document):
         """
         return self.names.get(language, self.names.get("en", self.off_id))
     
+    @staticmethod
+    def name_expr(language: str = "en") -> Dict[str, Any]:
+        """Aggregation expression equivalent of get_name()."""
+        return {"$ifNull": [
+            {"$getField": {"field": language, "input": "$names"}},
+            {"$ifNull": ["$names.en", "$off_id"]}
+        ]}
+    
     def is_top_level(self) -> bool:
         """Check if this is a top-level category (no parents)."""
         return len(self.parents) == 0
@@ -3,10 +3,35 @@ Ingredient model for MongoDB using Beanie ODM.
 Based on OpenFoodFacts ingredients taxonomy.
 """
 
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, UTC
-from typing import Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from beanie import Document
-from pydantic import Field
+from pydantic import BaseModel, Field
+
+
+# Process-local TTL/LRU cache for off_id lookups. Taxonomy data only changes
+# when the import scripts run, so a short TTL bounds staleness.
+_OFF_ID_CACHE_TTL = 300.0  # seconds
+_OFF_ID_CACHE_MAXSIZE = 4096
+_off_id_cache: "OrderedDict[str, Tuple[float, IngredientNames]]" = OrderedDict()
+
+
+class IngredientNames(BaseModel):
+    """
+    Read-only view of an Ingredient with just its off_id and names.
+    
+    Used where only display names are needed, so lookups can project the
+    two fields and skip building full Ingredient documents.
+    """
+    off_id: str
+    names: Dict[str, str] = Field(default_factory=dict)
+    
+    def get_name(self, language: str = "en") -> str:
+        """Same fallback rules as Ingredient.get_name()."""
+        return self.names.get(language, self.names.get("en", self.off_id))
 
 
 class Ingredient(Document):
@@ -82,6 +107,29 @@ class Ingredient(Document):
         """
         return self.names.get(language, self.names.get("en", self.off_id))
     
+    @staticmethod
+    def name_expr(language: str = "en") -> Dict[str, Any]:
+        """Aggregation expression equivalent of get_name()."""
+        return {"$ifNull": [
+            {"$getField": {"field": language, "input": "$names"}},
+            {"$ifNull": ["$names.en", "$off_id"]}
+        ]}
+    
+    @staticmethod
+    def property_flag_expr(prop: str) -> Dict[str, Any]:
+        """
+        Aggregation expression equivalent of is_vegan()/is_vegetarian():
+        "yes" -> true, "no" -> false, anything else -> null.
+        """
+        value = {"$toLower": {"$ifNull": [f"$properties.{prop}", ""]}}
+        return {"$switch": {
+            "branches": [
+                {"case": {"$eq": [value, "yes"]}, "then": True},
+                {"case": {"$eq": [value, "no"]}, "then": False}
+            ],
+            "default": None
+        }}
+    
     def is_vegan(self) -> Optional[bool]:
         """Check if ingredient is vegan."""
         vegan = self.properties.get("vegan", "").lower()
@@ -119,8 +167,9 @@ class Ingredient(Document):
         language: str = "en",
         limit: int = 50,
         skip: int = 0,
-        custom_only: bool = False
-    ) -> List["Ingredient"]:
+        custom_only: bool = False,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> List[Union["Ingredient", Dict[str, Any]]]:
         """
         Search ingredients by name in specified language.
         Uses regex for short queries (1-2 chars) and text search for longer queries.
@@ -132,22 +181,119 @@ class Ingredient(Document):
             limit: Maximum number of results
             skip: Number of results to skip (for pagination)
             custom_only: Only return custom ingredients
+            projection: Optional $project stage; when given, matches are
+                returned as projected dicts instead of Ingredient documents
         
         Returns:
             List of matching ingredients
         """
+        filters = cls._search_filters(query, language, custom_only)
+        if projection is None:
+            return await cls.find(filters).skip(skip).limit(limit).to_list()
+        return await cls.aggregate([
+            {"$match": filters},
+            {"$skip": skip},
+            {"$limit": limit},
+            {"$project": projection}
+        ]).to_list()
+    
+    @classmethod
+    async def search_with_total(
+        cls,
+        query: str,
+        language: str = "en",
+        limit: int = 50,
+        skip: int = 0,
+        custom_only: bool = False,
+        projection: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Union["Ingredient", Dict[str, Any]]], int]:
+        """
+        Search ingredients and count all matches in a single round-trip.
+        
+        Same matching rules as search(), but returns the requested page
+        together with the total number of matching ingredients.
+        
+        Args:
+            projection: Optional $project stage; when given, the page is
+                returned as projected dicts instead of Ingredient documents
+        
+        Returns:
+            Tuple of (matching ingredients for the page, total match count)
+        """
+        filters = cls._search_filters(query, language, custom_only)
+        page_stages = [{"$skip": skip}, {"$limit": limit}]
+        if projection is not None:
+            page_stages.append({"$project": projection})
+        pipeline = [
+            {"$match": filters},
+            {"$facet": {
+                "items": page_stages,
+                "total": [{"$count": "n"}]
+            }}
+        ]
+        result = (await cls.aggregate(pipeline).to_list())[0]
+        items = result["items"]
+        if projection is None:
+            items = [cls.model_validate(doc) for doc in items]
+        total = result["total"][0]["n"] if result["total"] else 0
+        return items, total
+    
+    @staticmethod
+    def _search_filters(query: str, language: str, custom_only: bool) -> Dict:
+        """Build the name prefix filter shared by search() and search_with_total()."""
         # Use case-insensitive regex for partial matching on ALL query lengths
         # This enables true autocomplete behavior (e.g., "oeu" finds "oeuf")
         # Note: For very large datasets, consider text search for complete words
         field_name = f"names.{language}"
-        filters = {field_name: {"$regex": f"^{query}", "$options": "i"}}
+        filters = {field_name: {"$regex": f"^{re.escape(query)}", "$options": "i"}}
         
         if custom_only:
             filters["custom"] = True
         
-        return await cls.find(filters).skip(skip).limit(limit).to_list()
+        return filters
     
     @classmethod
     async def get_by_off_id(cls, off_id: str) -> Optional["Ingredient"]:
         """Get ingredient by OpenFoodFacts ID."""
         return await cls.find_one({"off_id": off_id})
+    
+    @classmethod
+    async def get_many_by_off_id(cls, off_ids: Iterable[str]) -> Dict[str, IngredientNames]:
+        """
+        Get ingredient names by OpenFoodFacts ID, keyed by off_id.
+        
+        Recently fetched ingredients are served from an in-process cache;
+        the rest are fetched with a single $in query projected to off_id and
+        names. Unknown off_ids are simply absent from the result (and not
+        cached). Ingredients are only written by the import scripts, in
+        other processes, so a renamed ingredient can be served stale for up
+        to _OFF_ID_CACHE_TTL.
+        """
+        now = time.monotonic()
+        found: Dict[str, IngredientNames] = {}
+        misses: List[str] = []
+        
+        for off_id in dict.fromkeys(off_ids):
+            entry = _off_id_cache.get(off_id)
+            if entry is not None and entry[0] > now:
+                _off_id_cache.move_to_end(off_id)
+                found[off_id] = entry[1]
+            else:
+                misses.append(off_id)
+        
+        if misses:
+            expires = now + _OFF_ID_CACHE_TTL
+            docs = await cls.aggregate([
+                {"$match": {"off_id": {"$in": misses}}},
+                {"$project": {"_id": 0, "off_id": 1, "names": 1}}
+            ]).to_list()
+            for doc in docs:
+                # Raw documents from our own collection, so skip validation
+                ingredient = IngredientNames.model_construct(**doc)
+                found[ingredient.off_id] = ingredient
+                _off_id_cache[ingredient.off_id] = (expires, ingredient)
+                _off_id_cache.move_to_end(ingredient.off_id)
+            while len(_off_id_cache) > _OFF_ID_CACHE_MAXSIZE:
+                _off_id_cache.popitem(last=False)
+        
+        return found
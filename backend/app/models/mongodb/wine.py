@@ -1,7 +1,8 @@
 """
 Wine model for MongoDB using Beanie ODM.
 """
-from beanie import Document
+from beanie import Document, Insert, Replace, Save, SaveChanges, before_event
+from pymongo import IndexModel, ASCENDING, TEXT
 from pydantic import Field, BaseModel, validator
 from typing import Optional, List, Literal
 from datetime import datetime
@@ -26,6 +27,9 @@ class Wine(Document):
     # Basic Information
     name: str
     producer: Optional[str] = None
+    # Lowercased copies for index-backed prefix search (see set_search_fields)
+    name_lower: Optional[str] = None
+    producer_lower: Optional[str] = None
     vintage: Optional[int] = None
     country: str = ""
     region: str = ""
@@ -99,9 +103,74 @@ class Wine(Document):
             "region",
             "country",
             "vintage",
-            "user_id"
+            "user_id",
+            # Word search on name/producer ($text); no language so wine and
+            # producer names are neither stemmed nor stripped of stop words.
+            # Name matches weigh twice producer matches in the text score
+            IndexModel(
+                [("name", TEXT), ("producer", TEXT)],
+                name="wine_text_search",
+                default_language="none",
+                weights={"name": 10, "producer": 5}
+            ),
+            # Filter combinations of the master/cellier list endpoints; the
+            # trailing _id keeps keyset pagination on the same index
+            IndexModel(
+                [("user_id", ASCENDING), ("wine_type", ASCENDING), ("_id", ASCENDING)],
+                name="wine_user_type_id"
+            ),
+            IndexModel(
+                [("user_id", ASCENDING), ("wine_type", ASCENDING), ("region", ASCENDING), ("_id", ASCENDING)],
+                name="wine_user_type_region_id"
+            ),
+            IndexModel(
+                [("user_id", ASCENDING), ("country", ASCENDING), ("region", ASCENDING), ("_id", ASCENDING)],
+                name="wine_user_country_region_id"
+            ),
+            IndexModel(
+                [("user_id", ASCENDING), ("country", ASCENDING), ("_id", ASCENDING)],
+                name="wine_user_country_id"
+            ),
+            IndexModel(
+                [("user_id", ASCENDING), ("barcode", ASCENDING)],
+                name="wine_user_barcode"
+            ),
+            # Case-insensitive prefix search as an anchored, case-sensitive
+            # regex on the lowercased copies, i.e. an index range scan
+            IndexModel(
+                [("user_id", ASCENDING), ("name_lower", ASCENDING)],
+                name="wine_user_name_lower"
+            ),
+            IndexModel(
+                [("user_id", ASCENDING), ("producer_lower", ASCENDING)],
+                name="wine_user_producer_lower"
+            ),
+            # One master wine per barcode; also serves barcode scans.
+            # Cellier (user) wines and missing or empty barcodes are not constrained.
+            # Building it fails on existing duplicates: run
+            # scripts/dedupe_master_wine_barcodes.py before deploying
+            IndexModel(
+                [("barcode", ASCENDING)],
+                name="wine_master_barcode_unique",
+                unique=True,
+                partialFilterExpression={"user_id": None, "barcode": {"$type": "string", "$gt": ""}}
+            )
         ]
     
+    @staticmethod
+    def search_fields(name: Optional[str], producer: Optional[str]) -> dict:
+        """name_lower/producer_lower values for the given name and producer"""
+        return {
+            "name_lower": name.lower() if name else None,
+            "producer_lower": producer.lower() if producer else None
+        }
+    
+    @before_event(Insert, Replace, Save, SaveChanges)
+    def set_search_fields(self):
+        """Keep the lowercased search copies in sync with name/producer"""
+        for field, value in Wine.search_fields(self.name, self.producer).items():
+            setattr(self, field, value)
+    
     @validator('vintage')
     def validate_vintage(cls, v):
         if v is not None:
@@ -1,14 +1,18 @@
 """
 Recipe models
 """
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, ARRAY, Index, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 import uuid
 
 class Recipe(Base):
     __tablename__ = "recipes"
+    __table_args__ = (
+        Index("ix_recipes_equipment_gin", "equipment", postgresql_using="gin"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(500), nullable=False)
@@ -32,7 +36,16 @@ class Recipe(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"))
     is_public = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
+    
+    # Relationships
+    # Read-only: rows are written through RecipeIngredient.recipe_id
+    recipe_ingredients = relationship(
+        "RecipeIngredient",
+        order_by="RecipeIngredient.display_order",
+        lazy="select",
+        viewonly=True
+    )
 
 class RecipeTag(Base):
     __tablename__ = "recipe_tags"
@@ -1,7 +1,7 @@
 """
 Shopping list models
 """
-from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Numeric
+from sqlalchemy import Column, String, Text, Boolean, DateTime, ForeignKey, Numeric, Index, FetchedValue
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -14,10 +14,13 @@ class ShoppingList(Base):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(255), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
 
 class ShoppingListItem(Base):
     __tablename__ = "shopping_list_items"
+    __table_args__ = (
+        Index("ix_shopping_list_items_off_id", "ingredient_off_id"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     shopping_list_id = Column(UUID(as_uuid=True), ForeignKey("shopping_lists.id", ondelete="CASCADE"), nullable=False)
@@ -30,4 +33,4 @@ class ShoppingListItem(Base):
     matched_special_id = Column(UUID(as_uuid=True), ForeignKey("grocery_specials.id", ondelete="SET NULL"))
     notes = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue())  # set by DB trigger
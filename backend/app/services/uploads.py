@@ -0,0 +1,80 @@
+"""
+Streaming storage for uploaded files
+"""
+import os
+import secrets
+from typing import Optional, Union
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Stored file extension by declared image type (including common aliases);
+# the client's filename is never used for the stored name
+IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/pjpeg": ".jpg",
+    "image/png": ".png",
+    "image/x-png": ".png",
+    "image/webp": ".webp",
+    "image/gif": ".gif",
+    "image/heic": ".heic",
+    "image/heif": ".heif",
+    "image/avif": ".avif",
+}
+
+
+def unique_image_filename(content_type: Optional[str], prefix: str = "") -> str:
+    """
+    Random upload filename with the extension of the declared image type.
+    
+    Types missing from IMAGE_EXTENSIONS are rejected with a 415, so every
+    stored image gets an extension the static file server maps to an image
+    content type.
+    """
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    extension = IMAGE_EXTENSIONS.get(media_type)
+    if extension is None:
+        raise HTTPException(
+            status_code=415,
+            detail="Unsupported image type (use JPEG, PNG, WebP, GIF, HEIC or AVIF)"
+        )
+    return f"{prefix}{secrets.token_hex(16)}{extension}"
+
+
+async def save_upload(
+    file: UploadFile,
+    file_path: Union[str, os.PathLike],
+    max_size: int,
+    too_large_detail: str = "File too large"
+) -> int:
+    """
+    Stream an uploaded file to disk and return its size in bytes.
+
+    The upload is copied in UPLOAD_CHUNK_SIZE chunks, so memory use does not
+    grow with the file, and it stops with a 413 as soon as max_size is
+    exceeded. The parent directory is created if needed; disk I/O runs in
+    the threadpool to keep the event loop free. The partial file is removed
+    if anything fails.
+    """
+    await run_in_threadpool(os.makedirs, os.path.dirname(file_path), exist_ok=True)
+    total = 0
+    try:
+        out = await run_in_threadpool(open, file_path, "wb")
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total += len(chunk)
+                if total > max_size:
+                    raise HTTPException(status_code=413, detail=too_large_detail)
+                await run_in_threadpool(out.write, chunk)
+        finally:
+            await run_in_threadpool(out.close)
+    except BaseException:
+        try:
+            os.unlink(file_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return total
@@ -0,0 +1,37 @@
+"""
+Valid Ingredients Sync Service
+Mirrors MongoDB ingredient off_ids into the Postgres valid_ingredients table,
+which recipe_ingredients.ingredient_off_id references
+"""
+from typing import Iterable
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.core.database import SessionLocal
+from app.models.ingredient import ValidIngredient
+from app.models.mongodb.ingredient import Ingredient
+
+
+def write_valid_ingredients(off_ids: Iterable[str]) -> None:
+    """Insert the given off_ids into valid_ingredients, skipping known ones"""
+    rows = [{"off_id": off_id} for off_id in off_ids]
+    if not rows:
+        return
+    db = SessionLocal()
+    try:
+        db.execute(pg_insert(ValidIngredient).on_conflict_do_nothing(), rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+async def sync_valid_ingredients() -> int:
+    """
+    Insert any MongoDB ingredient off_ids missing from valid_ingredients.
+    
+    Off_ids are never removed, since existing recipes may still reference
+    them. Returns the number of off_ids found in MongoDB.
+    """
+    off_ids = await Ingredient.distinct("off_id")
+    await run_in_threadpool(write_valid_ingredients, off_ids)
+    return len(off_ids)
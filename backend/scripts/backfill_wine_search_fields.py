@@ -0,0 +1,53 @@
+"""
+Backfill the lowercased name_lower/producer_lower search fields on wines.
+
+New and updated wines get these fields automatically; run this once after
+deploying so wines written before then show up in prefix searches.
+Lowercasing is done in Python (same as the API) rather than with $toLower,
+which is only well-defined for ASCII.
+
+Usage:
+    python scripts/backfill_wine_search_fields.py
+"""
+import sys
+import os
+import asyncio
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import UpdateOne
+
+from app.core.database import init_mongodb, close_mongodb
+from app.models.mongodb import Wine
+
+BATCH_SIZE = 1000
+
+
+async def main():
+    await init_mongodb()
+    try:
+        collection = Wine.get_pymongo_collection()
+        cursor = collection.find(
+            {"name_lower": {"$exists": False}},
+            projection={"name": 1, "producer": 1}
+        )
+        updates = []
+        total = 0
+        async for doc in cursor:
+            updates.append(UpdateOne(
+                {"_id": doc["_id"]},
+                {"$set": Wine.search_fields(doc.get("name"), doc.get("producer"))}
+            ))
+            if len(updates) >= BATCH_SIZE:
+                await collection.bulk_write(updates, ordered=False)
+                total += len(updates)
+                updates = []
+        if updates:
+            await collection.bulk_write(updates, ordered=False)
+            total += len(updates)
+        print(f"✅ Search fields backfilled on {total:,} wines")
+    finally:
+        await close_mongodb()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
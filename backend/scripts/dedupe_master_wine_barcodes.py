@@ -0,0 +1,69 @@
+"""
+Resolve duplicate barcodes on master wines before the unique barcode index ships.
+
+The wine_master_barcode_unique index (one master wine per non-empty barcode)
+is built by init_beanie at API startup, and that build fails if the master
+list already holds duplicates, which the API used to accept. Run this once
+BEFORE deploying the release that adds the index.
+
+For each duplicated barcode the oldest master wine (created_at, then _id)
+keeps it; the barcode is cleared (set to null) on the others, which are
+listed so they can be merged or fixed by hand. Cellier (user) wines are
+not touched. It talks to MongoDB directly rather than through init_mongodb,
+which would try to build the index first.
+
+Usage:
+    python scripts/dedupe_master_wine_barcodes.py [--dry-run]
+"""
+import sys
+import os
+import argparse
+import asyncio
+from datetime import datetime, timezone
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pymongo import AsyncMongoClient, UpdateMany
+
+from app.core.config import settings
+
+
+async def main(dry_run: bool):
+    client = AsyncMongoClient(getattr(settings, 'MONGODB_URL', 'mongodb://localhost:27017'))
+    try:
+        collection = client[getattr(settings, 'MONGODB_DB_NAME', 'legrimoire')]["wines"]
+        duplicates = collection.aggregate([
+            # Same filter as the index's partialFilterExpression
+            {"$match": {"user_id": None, "barcode": {"$type": "string", "$gt": ""}}},
+            {"$sort": {"created_at": 1, "_id": 1}},
+            {"$group": {
+                "_id": "$barcode",
+                "wines": {"$push": {"_id": "$_id", "name": "$name"}},
+                "count": {"$sum": 1}
+            }},
+            {"$match": {"count": {"$gt": 1}}}
+        ])
+        updates = []
+        async for group in duplicates:
+            keep, *others = group["wines"]
+            print(f"🔁 {group['_id']}: kept on {keep['_id']} ({keep.get('name')})")
+            for wine in others:
+                print(f"   cleared on {wine['_id']} ({wine.get('name')})")
+            updates.append(UpdateMany(
+                {"_id": {"$in": [wine["_id"] for wine in others]}},
+                {"$set": {"barcode": None, "updated_at": datetime.now(timezone.utc)}}
+            ))
+        if not updates:
+            print("✅ No duplicate master wine barcodes")
+        elif dry_run:
+            print(f"ℹ️  Dry run: {len(updates):,} duplicated barcodes left unchanged")
+        else:
+            await collection.bulk_write(updates, ordered=False)
+            print(f"✅ Resolved {len(updates):,} duplicated barcodes")
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resolve duplicate master wine barcodes")
+    parser.add_argument("--dry-run", action="store_true", help="List duplicates without changing them")
+    asyncio.run(main(parser.parse_args().dry_run))
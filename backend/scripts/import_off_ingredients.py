@@ -15,6 +15,9 @@ from pymongo import MongoClient, IndexModel, TEXT, ASCENDING
 from pymongo.errors import DuplicateKeyError
 import os
 from datetime import datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.services.valid_ingredients import write_valid_ingredients
 
 
 def load_taxonomy(taxonomy_path: Path) -> dict:
@@ -157,6 +160,11 @@ def import_ingredients(mongodb_url: str, db_name: str, taxonomy_path: Path):
     # Create indexes
     create_indexes(collection)
     
+    # Recipes can only reference off_ids mirrored in Postgres
+    print("\n🔗 Syncing valid_ingredients...")
+    write_valid_ingredients(collection.distinct('off_id'))
+    print("   ✅ valid_ingredients synced")
+    
     # Summary
     final_count = collection.count_documents({})
     print(f"\n{'='*70}")
@@ -197,6 +197,13 @@ def main():
             total_imported += imported
             total_skipped += skipped
         
+        # CSV rows carry explicit ids, so move the identity sequence past them
+        db.execute(text(
+            "SELECT setval(pg_get_serial_sequence('ingredients', 'id'), "
+            "COALESCE(MAX(id), 0) + 1, false) FROM ingredients"
+        ))
+        db.commit()
+        
         # Print summary
         print("\n" + "=" * 70)
         print("📊 SEEDING SUMMARY")
@@ -423,6 +423,11 @@ async def seed_mongodb_ingredients():
         
         print(f"✅ Created {len(test_ingredients)} test ingredients in MongoDB")
         
+        # Recipes can only reference off_ids mirrored in Postgres
+        from app.services.valid_ingredients import sync_valid_ingredients
+        await sync_valid_ingredients()
+        print("✅ valid_ingredients synced")
+        
     except ImportError:
         print("   ⚠️  MongoDB dependencies not available, skipping")
     except Exception as e:
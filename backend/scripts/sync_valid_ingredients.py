@@ -0,0 +1,31 @@
+"""
+Sync MongoDB ingredient off_ids into the Postgres valid_ingredients table.
+
+The API syncs on startup (logging, not failing, on error) and
+import_off_ingredients.py syncs after an import. Run this after any other
+change to MongoDB ingredients, and after each deploy so a failed startup
+sync is caught; it exits non-zero on failure.
+
+Usage:
+    python scripts/sync_valid_ingredients.py
+"""
+import sys
+import os
+import asyncio
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.database import init_mongodb, close_mongodb
+from app.services.valid_ingredients import sync_valid_ingredients
+
+
+async def main():
+    await init_mongodb()
+    try:
+        count = await sync_valid_ingredients()
+        print(f"✅ valid_ingredients synced ({count:,} off_ids in MongoDB)")
+    finally:
+        await close_mongodb()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -180,7 +180,11 @@ echo "   sudo cp /etc/letsencrypt/live/legrimoireonline.ca/*.pem ~/apps/le-grimo
 echo "   sudo chown legrimoire:legrimoire ~/apps/le-grimoire/nginx/ssl/*"
 echo ""
 echo "2. 🚀 Start the application:"
+echo "   When upgrading, first resolve duplicate master wine barcodes (the new"
+echo "   unique barcode index cannot be built at startup while they exist):"
+echo "   docker compose -f docker-compose.prod.yml run --rm backend python scripts/dedupe_master_wine_barcodes.py"
 echo "   docker compose -f docker-compose.prod.yml up -d"
+echo "   docker compose -f docker-compose.prod.yml exec backend python scripts/sync_valid_ingredients.py"
 echo ""
 echo "3. 📊 Monitor the logs:"
 echo "   docker compose -f docker-compose.prod.yml logs -f"